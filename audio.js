@@ -18,6 +18,10 @@ class AudioController {
         this.currentAudio = null; // Currently playing Audio object
         this.audioUnlocked = false; // Track if audio context is unlocked
         this.pendingAudioQueue = []; // Queue for audio that needs to wait for unlock
+        this.packUrls = {}; // Audio path -> object URL from the active level's bundle
+        this.activePack = null; // Level whose bundle is loaded (or loading)
+        this.slowSpeeds = [0.9, 0.75]; // Slow renditions built by audio_renditions.py, slowest last
+        this.missingRenditions = new Set(); // Rendition paths that failed to load
 
         this.initializeVoice(); // Still initialize for fallback
         
@@ -110,6 +114,47 @@ class AudioController {
         });
     }
 
+    // Load a level's audio bundle and serve its clips from memory.
+    // pack is the level's content.json, baseUrl the directory it was loaded from.
+    async loadPack(pack, baseUrl) {
+        this.unloadPack();
+        const level = pack.level;
+        this.activePack = level;
+
+        const response = await fetch(`${baseUrl}/${pack.bundle}`);
+        if (!response.ok) {
+            throw new Error(`Failed to load audio bundle for level ${level}: ${response.status}`);
+        }
+        const buffer = await response.arrayBuffer();
+
+        // Another level was selected while this bundle was downloading
+        if (this.activePack !== level) return;
+
+        const urls = {};
+        Object.entries(pack.audio).forEach(([audioPath, [offset, length]]) => {
+            const blob = new Blob([new Uint8Array(buffer, offset, length)], { type: 'audio/mpeg' });
+            urls[audioPath] = URL.createObjectURL(blob);
+        });
+        this.packUrls = urls;
+        console.log(`Loaded audio bundle for level ${level}: ${Object.keys(urls).length} clips`);
+    }
+
+    // Release the active bundle so memory stays flat as levels change
+    unloadPack() {
+        Object.entries(this.packUrls).forEach(([audioPath, url]) => {
+            if (this.audioCache[audioPath] && this.audioCache[audioPath] !== this.currentAudio) {
+                delete this.audioCache[audioPath];
+            }
+            URL.revokeObjectURL(url);
+        });
+        this.packUrls = {};
+        this.activePack = null;
+    }
+
+    _resolveAudioPath(audioPath) {
+        return this.packUrls[audioPath] || audioPath;
+    }
+
     _preloadAudio(audioPath) {
         if (this.audioCache[audioPath]) return;
         
@@ -121,24 +166,48 @@ class AudioController {
         }
         
         audio.preload = 'auto';
-        audio.src = audioPath;
+        audio.src = this._resolveAudioPath(audioPath);
         this.audioCache[audioPath] = audio;
     }
 
     _processPendingAudioQueue() {
         // Process any audio that was queued while waiting for unlock
         while (this.pendingAudioQueue.length > 0) {
-            const { audioPath, onEnd, resolve, reject } = this.pendingAudioQueue.shift();
-            this._playStaticAudio(audioPath, onEnd).then(resolve).catch(reject);
+            const { audioPath, onEnd, playbackRate, resolve, reject } = this.pendingAudioQueue.shift();
+            this._playStaticAudio(audioPath, onEnd, playbackRate).then(resolve).catch(reject);
         }
     }
 
-    _playStaticAudio(audioPath, onEnd) {
+    // audio/words/her.mp3 at 0.75x -> audio/words/slow-75/her.mp3
+    _renditionPath(audioPath, speed) {
+        const slash = audioPath.lastIndexOf('/');
+        return `${audioPath.slice(0, slash)}/slow-${Math.round(speed * 100)}${audioPath.slice(slash)}`;
+    }
+
+    // Play a clip slowed down: the pre-built rendition when there is one, otherwise
+    // the normal clip stretched by the browser (pitch-preserving, but lower quality)
+    async _playAtSpeed(audioPath, speed, onEnd) {
+        if (speed === 1) {
+            return this._playStaticAudio(audioPath, onEnd);
+        }
+        const renditionPath = this._renditionPath(audioPath, speed);
+        if (!this.missingRenditions.has(renditionPath)) {
+            try {
+                return await this._playStaticAudio(renditionPath, onEnd);
+            } catch (error) {
+                this.missingRenditions.add(renditionPath);
+                delete this.audioCache[renditionPath];
+            }
+        }
+        return this._playStaticAudio(audioPath, onEnd, speed);
+    }
+
+    _playStaticAudio(audioPath, onEnd, playbackRate = 1) {
         return new Promise((resolve, reject) => {
             // For iOS Safari, queue audio if not unlocked yet
             if (this.isIOS && this.isSafari && !this.audioUnlocked) {
                 console.log(`Queuing audio for iOS Safari unlock: ${audioPath}`);
-                this.pendingAudioQueue.push({ audioPath, onEnd, resolve, reject });
+                this.pendingAudioQueue.push({ audioPath, onEnd, playbackRate, resolve, reject });
                 return;
             }
 
@@ -151,11 +220,15 @@ class AudioController {
             let audio = this.audioCache[audioPath];
             
             if (!audio) {
-                audio = new Audio(audioPath);
+                audio = new Audio(this._resolveAudioPath(audioPath));
                 this.audioCache[audioPath] = audio;
             }
 
             this.currentAudio = audio;
+            // Cached Audio objects are reused, so always reset the rate
+            audio.playbackRate = playbackRate;
+            audio.preservesPitch = true;
+            audio.webkitPreservesPitch = true;
 
             const handleEnd = () => {
                 audio.removeEventListener('ended', handleEnd);
@@ -186,7 +259,7 @@ class AudioController {
         });
     }
 
-    _playFallbackSpeech(text, onEnd) {
+    _playFallbackSpeech(text, onEnd, rate = this.rate) {
         if (!this.isSupported) {
             console.warn('Speech synthesis not supported');
             if (onEnd) onEnd();
@@ -198,7 +271,7 @@ class AudioController {
 
         const utterance = new SpeechSynthesisUtterance(text);
         utterance.voice = this.voice;
-        utterance.rate = this.rate;
+        utterance.rate = rate;
         utterance.pitch = this.pitch;
         utterance.volume = this.volume;
 
@@ -332,15 +405,15 @@ class AudioController {
         }
     }
 
-    async speakWord(word, onEnd) {
+    async speakWord(word, onEnd, speed = 1) {
         try {
             // Try to play static word audio
             const audioPath = `audio/words/${word.toLowerCase()}.mp3`;
-            await this._playStaticAudio(audioPath, onEnd);
+            await this._playAtSpeed(audioPath, speed, onEnd);
         } catch (error) {
             // Fallback to speech synthesis
             console.log(`Using fallback speech for word: "${word}"`);
-            this._playFallbackSpeech(word, onEnd);
+            this._playFallbackSpeech(word, onEnd, this.rate * speed);
         }
     }
 
@@ -432,14 +505,14 @@ class AudioController {
         }
     }
 
-    async spellWord(word, onEnd) {
+    async spellWord(word, onEnd, speed = 1) {
         try {
             // Try to spell using individual letter audio files
             const letters = word.toLowerCase().split('');
             for (let i = 0; i < letters.length; i++) {
                 const letter = letters[i];
                 const audioPath = `audio/letters/${letter}.mp3`;
-                await this._playStaticAudio(audioPath);
+                await this._playAtSpeed(audioPath, speed);
                 
                 // Small pause between letters
                 if (i < letters.length - 1) {
@@ -450,20 +523,20 @@ class AudioController {
         } catch (error) {
             // Fallback to speech synthesis spelling
             console.log(`Using fallback speech for spelling: "${word}"`);
-            this._playFallbackSpeech(word, onEnd);
+            this._playFallbackSpeech(word, onEnd, this.rate * speed);
         }
     }
 
-    async spellLetter(letter, onEnd) {
+    async spellLetter(letter, onEnd, speed = 1) {
         try {
             // Play individual letter audio
             const audioPath = `audio/letters/${letter.toLowerCase()}.mp3`;
-            await this._playStaticAudio(audioPath);
+            await this._playAtSpeed(audioPath, speed);
             if (onEnd) onEnd();
         } catch (error) {
             // Fallback to speech synthesis
             console.log(`Using fallback speech for letter: "${letter}"`);
-            this._playFallbackSpeech(letter, onEnd);
+            this._playFallbackSpeech(letter, onEnd, this.rate * speed);
         }
     }
 
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Incremental audio build - synthesizes only the clips whose content changed and
+runs the downstream stages for the affected outputs
+"""
+
+import os
+import random
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+from audio_catalog import SOURCES, build_catalog, load_source, plan_changes
+from audio_manifest import file_digest, load_manifest, record_clip, remove_clip, save_manifest
+from audio_pipeline import Pipeline, Stage
+
+# Rate limiting (429), server errors and dropped connections (None) are worth retrying
+RETRY_STATUSES = {None, 429, 500, 502, 503, 504}
+SYNTH_RETRIES = 4
+RETRY_BACKOFF = 1.0  # Seconds before the first retry, doubled for each one after
+
+# Leading/trailing silence removal; the same filter runs on the reversed audio for the tail
+TRIM_FILTER = ("silenceremove=start_periods=1:start_threshold=-50dB,areverse,"
+               "silenceremove=start_periods=1:start_threshold=-50dB,areverse")
+
+
+def process_clip(job):
+    """CPU-bound post-processing of a freshly synthesized clip (runs in a worker process)"""
+    staging_path = job['staging_path']
+    if job.get('trim'):
+        trimmed_path = staging_path + '.trim.mp3'
+        result = subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-i", staging_path,
+             "-af", TRIM_FILTER, "-codec:a", "libmp3lame", "-q:a", "2", trimmed_path],
+            capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg could not trim {job['output_path']}: {result.stderr.strip()}")
+        os.replace(trimmed_path, staging_path)
+
+    job['sha256'] = file_digest(staging_path)
+    job['bytes'] = os.path.getsize(staging_path)
+    return job
+
+
+class AudioBuilder:
+    def __init__(self, api_key=None, synth_workers=2, process_workers=None, queue_size=8,
+                 trim=False):
+        self.api_key = api_key or os.getenv('ELEVENLABS_API_KEY')
+        self.modules = {}
+        self.generators = {}
+
+        # Synthesis is network-bound; keep it within the API's concurrency limit
+        self.synth_workers = synth_workers
+        self.process_workers = process_workers or min(4, os.cpu_count() or 1)
+        self.queue_size = queue_size
+        self.trim = trim
+        if self.trim and not shutil.which("ffmpeg"):
+            print("⚠️  ffmpeg not found, clips will not be trimmed")
+            self.trim = False
+
+        # Downstream stages run after synthesis with (manifest, catalog, changed, removed)
+        # and only ever see the outputs that were affected. A stage may return the
+        # outputs it derived, which later stages then see as changed too
+        self.downstream = [self.update_manifest, self.update_renditions, self.update_packs]
+
+    def load_sources(self, module_names=None):
+        """(Re)load the given content sources; returns the ones that loaded cleanly"""
+        if module_names is None:
+            module_names = [module_name for module_name, _, _ in SOURCES]
+        loaded = []
+        for module_name in module_names:
+            try:
+                self.modules[module_name] = load_source(module_name, fresh=True)
+            except Exception as e:
+                print(f"⚠️  Could not load {module_name}.py, keeping previous content: {e}")
+                continue
+            # The generator class may have changed along with the content
+            self.generators.pop(module_name, None)
+            loaded.append(module_name)
+        return loaded
+
+    def catalog(self):
+        return build_catalog(self.modules)
+
+    def generator_for(self, clip):
+        """Generator instance owning a clip, created on first use"""
+        module_name = clip['source']
+        if module_name not in self.generators:
+            generator_class = getattr(self.modules[module_name], clip['generator'])
+            self.generators[module_name] = generator_class(api_key=self.api_key)
+        return self.generators[module_name]
+
+    def synthesize_stage(self, catalog, output_path):
+        """Request one clip from the API into a staging file next to its final path"""
+        clip = catalog[output_path]
+        staging_path = output_path + '.tmp'
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        generator = self.generator_for(clip)
+        for attempt in range(SYNTH_RETRIES + 1):
+            if generator.generate_audio(clip['text'], staging_path):
+                break
+            Path(staging_path).unlink(missing_ok=True)
+            status = generator.statuses.get(staging_path)
+            if status not in RETRY_STATUSES or attempt == SYNTH_RETRIES:
+                return None
+            # Jitter keeps the synthesis workers from retrying in lockstep
+            delay = RETRY_BACKOFF * 2 ** attempt * random.uniform(0.5, 1.5)
+            print(f"⏳ Retrying {output_path} in {delay:.1f}s (HTTP {status or 'connection error'})")
+            time.sleep(delay)
+        return {"output_path": output_path, "staging_path": staging_path, "trim": self.trim}
+
+    def publish_stage(self, manifest, catalog, generated, job):
+        """Move a processed clip into place and record it; runs on a single thread"""
+        output_path = job['output_path']
+        os.replace(job['staging_path'], output_path)
+        record_clip(manifest, output_path, catalog[output_path],
+                    sha256=job['sha256'], size=job['bytes'])
+        generated.append(output_path)
+        print(f"📦 Published: {output_path}")
+        return job
+
+    def synthesize(self, manifest, catalog, output_paths):
+        """Run synthesis, post-processing and publishing concurrently; returns the paths published"""
+        if not output_paths:
+            return []
+        if not self.api_key:
+            # The generators exit the process without a key, which would end watch mode
+            print(f"❌ ELEVENLABS_API_KEY is not set, {len(output_paths)} clips not synthesized")
+            return []
+
+        # Create generators up front so worker threads never race to do it
+        for output_path in output_paths:
+            self.generator_for(catalog[output_path])
+
+        generated = []
+        pipeline = Pipeline([
+            Stage("synthesize", lambda output_path: self.synthesize_stage(catalog, output_path),
+                  workers=self.synth_workers),
+            Stage("process", process_clip, workers=self.process_workers, processes=True),
+            Stage("publish", lambda job: self.publish_stage(manifest, catalog, generated, job)),
+        ], queue_size=self.queue_size)
+        pipeline.run(output_paths)
+        pipeline.report()
+        return generated
+
+    def update_manifest(self, manifest, catalog, changed, removed):
+        """Record affected clips that the publish stage has not already recorded"""
+        for output_path in changed:
+            entry = manifest['clips'].get(output_path)
+            if entry is None or entry['fingerprint'] != catalog[output_path]['fingerprint']:
+                record_clip(manifest, output_path, catalog[output_path])
+        for output_path in removed:
+            remove_clip(manifest, output_path)
+
+    def update_renditions(self, manifest, catalog, changed, removed):
+        """Derive slow renditions for new or changed word and letter clips"""
+        from audio_renditions import derive_renditions, remove_renditions
+
+        for output_path in removed:
+            remove_renditions(output_path)
+        return derive_renditions(manifest, workers=self.process_workers, queue_size=self.queue_size)
+
+    def update_packs(self, manifest, catalog, changed, removed):
+        """Rebuild the content packs that bundle any of the affected clips"""
+        from build_content_packs import ContentPackBuilder
+
+        ContentPackBuilder.from_sources().rebuild_affected(manifest, catalog, changed, removed)
+
+    def apply(self, catalog):
+        """Bring the audio tree in line with the catalog; returns a summary"""
+        manifest = load_manifest()
+        plan = plan_changes(catalog, manifest)
+
+        generated = self.synthesize(manifest, catalog, plan['synthesize'])
+        for output_path in plan['removed']:
+            Path(output_path).unlink(missing_ok=True)
+            print(f"🗑️  Removed: {output_path}")
+
+        # Downstream stages run on every build, since some of their inputs (levels,
+        # distractors) can change without any clip changing
+        changed = generated + plan['adopt']
+        for stage in self.downstream:
+            changed += stage(manifest, catalog, changed, plan['removed']) or []
+        if changed or plan['removed'] or plan['synthesize']:
+            save_manifest(manifest)
+
+        return {
+            "generated": len(generated),
+            "failed": len(plan['synthesize']) - len(generated),
+            "adopted": len(plan['adopt']),
+            "removed": len(plan['removed'])
+        }
+
+    def build(self):
+        """Load every source and bring the audio tree up to date"""
+        self.load_sources()
+        return self.apply(self.catalog())
+
+
+def report(label, summary, elapsed):
+    print(f"🔁 {label}: {summary['generated']} regenerated, "
+          f"{summary['failed']} failed, {summary['adopted']} adopted, "
+          f"{summary['removed']} removed in {elapsed:.1f}s")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Catalog of every clip the audio generator scripts produce, built straight from
+the content defined in those scripts
+"""
+
+import hashlib
+import importlib
+import json
+import sys
+import types
+from pathlib import Path
+
+# (module, generator class, clip functions) for every content source
+SOURCES = [
+    ("generate_high_quality_audio", "HighQualityAudioGenerator",
+     ["word_clips", "letter_clips", "encouragement_clips", "correction_clips", "test_clips"]),
+    ("generate_additional_audio", "AdditionalAudioGenerator", ["dynamic_phrase_clips"]),
+    ("generate_word_stories_audio", "WordStoriesAudioGenerator", ["word_story_clips"]),
+]
+
+
+def source_path(module_name):
+    """Path of the script that defines a content source"""
+    return Path(__file__).resolve().with_name(f"{module_name}.py")
+
+
+def load_source(module_name, fresh=False):
+    """Import a content source; fresh=True re-executes the file from disk.
+
+    A fresh load skips the bytecode cache, whose one-second mtime resolution
+    would miss two quick saves of the same script.
+    """
+    if not fresh:
+        return importlib.import_module(module_name)
+
+    path = source_path(module_name)
+    module = types.ModuleType(module_name)
+    module.__file__ = str(path)
+    code = compile(path.read_text(encoding='utf-8'), str(path), 'exec')
+    exec(code, module.__dict__)
+    sys.modules[module_name] = module
+    return module
+
+
+def clip_fingerprint(text, voice_id, model_id, voice_settings):
+    """Hash of everything that affects the synthesized audio"""
+    payload = json.dumps({
+        "text": text,
+        "voice_id": voice_id,
+        "model_id": model_id,
+        "voice_settings": voice_settings
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def source_clips(module):
+    """Catalog entries for one loaded content source, keyed by output path"""
+    for module_name, generator_name, clip_functions in SOURCES:
+        if module_name == module.__name__:
+            break
+    else:
+        raise KeyError(f"Unknown content source: {module.__name__}")
+
+    clips = {}
+    for function_name in clip_functions:
+        category = function_name[:-len("_clips")]
+        for text, output_path in getattr(module, function_name)():
+            clips[str(output_path)] = {
+                "category": category,
+                "text": text,
+                "source": module_name,
+                "generator": generator_name,
+                "fingerprint": clip_fingerprint(text, module.VOICE_ID, module.MODEL_ID,
+                                                module.VOICE_SETTINGS)
+            }
+    return clips
+
+
+def build_catalog(modules=None):
+    """Catalog of every clip, keyed by output path.
+
+    modules maps module name -> already loaded module, so callers that reload
+    a single source can reuse the others.
+    """
+    modules = modules or {}
+    catalog = {}
+    for module_name, _, _ in SOURCES:
+        module = modules.get(module_name) or load_source(module_name)
+        catalog.update(source_clips(module))
+    return catalog
+
+
+def plan_changes(catalog, manifest):
+    """Work out the minimal set of clips to synthesize.
+
+    Returns a dict with:
+      synthesize - clips that are missing or whose content/voice changed
+      adopt      - clips already on disk that the manifest has not seen yet;
+                   they are recorded as-is, like the generators' "already exists"
+      removed    - generated clips that no longer appear in any content source
+    """
+    recorded = manifest['clips']
+    plan = {"synthesize": [], "adopt": [], "removed": []}
+
+    for output_path, clip in catalog.items():
+        entry = recorded.get(output_path)
+        if not Path(output_path).exists():
+            plan["synthesize"].append(output_path)
+        elif entry is None:
+            plan["adopt"].append(output_path)
+        elif entry.get("fingerprint") != clip["fingerprint"]:
+            plan["synthesize"].append(output_path)
+
+    for output_path, entry in recorded.items():
+        if entry.get("source") and output_path not in catalog:
+            plan["removed"].append(output_path)
+
+    return plan
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Audio manifest - records every generated clip, the content it was made from
+and the hash of the file on disk
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+MANIFEST_PATH = Path("audio/manifest.json")
+MANIFEST_VERSION = 1
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Load the manifest, or return an empty one if it does not exist yet"""
+    path = Path(path)
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        manifest.setdefault('clips', {})
+        return manifest
+    return {"version": MANIFEST_VERSION, "clips": {}}
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    """Write the manifest atomically so the game never sees a half-written file"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def file_digest(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def record_clip(manifest, output_path, clip, sha256=None, size=None):
+    """Add or refresh the manifest entry for a clip that exists on disk.
+
+    Pass sha256/size when they are already known to skip re-reading the file.
+    """
+    output_path = str(output_path)
+    previous = manifest['clips'].get(output_path, {})
+    manifest['clips'][output_path] = {
+        "category": clip['category'],
+        "text": clip['text'],
+        "source": clip['source'],
+        "fingerprint": clip['fingerprint'],
+        "sha256": sha256 or file_digest(output_path),
+        "bytes": size if size is not None else os.path.getsize(output_path)
+    }
+    # Renditions remember which version of the clip they came from, so they can
+    # be kept here and re-derived only once that version changes
+    if previous.get('renditions'):
+        manifest['clips'][output_path]['renditions'] = previous['renditions']
+
+
+def record_rendition(manifest, output_path, speed, rendition_path, sha256=None, size=None):
+    """Record a rendition (e.g. a slowed-down copy) derived from a clip's current file"""
+    entry = manifest['clips'][str(output_path)]
+    entry.setdefault('renditions', {})[f"{speed:g}"] = {
+        "path": str(rendition_path),
+        "source_sha256": entry['sha256'],
+        "sha256": sha256 or file_digest(rendition_path),
+        "bytes": size if size is not None else os.path.getsize(rendition_path)
+    }
+
+
+def clip_files(manifest):
+    """Every file the manifest accounts for, clips and renditions, with its recorded sha256"""
+    files = {}
+    for output_path, entry in manifest['clips'].items():
+        files[output_path] = entry['sha256']
+        for rendition in entry.get('renditions', {}).values():
+            files[rendition['path']] = rendition['sha256']
+    return files
+
+
+def remove_clip(manifest, output_path):
+    """Drop a clip from the manifest; returns the old entry if there was one"""
+    return manifest['clips'].pop(str(output_path), None)
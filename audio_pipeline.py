@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Staged streaming pipeline with bounded queues
+
+Items flow through a chain of stages, each with its own worker threads. A stage
+can run its function in a process pool for CPU-bound work. Queues between
+stages are bounded, so a slow stage blocks the ones upstream of it instead of
+letting finished work pile up in memory.
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+_DONE = object()
+
+
+class Stage:
+    def __init__(self, name, func, workers=1, processes=False):
+        """func(item) returns the item for the next stage, or None to drop it.
+
+        With processes=True func must be picklable (a module-level function);
+        each worker thread keeps one call in flight in the shared process pool.
+        """
+        if workers < 1:
+            # Without a worker nothing would pass the end marker on, hanging the stages after it
+            raise ValueError(f"stage {name!r} needs at least one worker, got {workers}")
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.processes = processes
+
+        self.items = 0
+        self.dropped = 0
+        self.errors = 0
+        self.busy_seconds = 0.0     # Inside func
+        self.starved_seconds = 0.0  # Waiting for input
+        self.blocked_seconds = 0.0  # Waiting for room downstream (backpressure)
+        self._lock = threading.Lock()
+
+    def add_time(self, busy=0.0, starved=0.0, blocked=0.0):
+        with self._lock:
+            self.busy_seconds += busy
+            self.starved_seconds += starved
+            self.blocked_seconds += blocked
+
+    def metrics(self, wall_seconds):
+        capacity = max(wall_seconds * self.workers, 1e-9)
+        return {
+            "stage": self.name,
+            "workers": self.workers,
+            "items": self.items,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "busy_seconds": self.busy_seconds,
+            "utilization": self.busy_seconds / capacity,
+            "starved": self.starved_seconds / capacity,
+            "blocked": self.blocked_seconds / capacity
+        }
+
+
+class Pipeline:
+    def __init__(self, stages, queue_size=8):
+        if queue_size < 1:
+            # queue.Queue(0) is unbounded, which would turn backpressure off
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.wall_seconds = 0.0
+
+    def _worker(self, stage, inbox, outbox, pool, remaining):
+        while True:
+            started = time.monotonic()
+            item = inbox.get()
+            stage.add_time(starved=time.monotonic() - started)
+            if item is _DONE:
+                break
+
+            started = time.monotonic()
+            try:
+                if pool is not None:
+                    result = pool.submit(stage.func, item).result()
+                else:
+                    result = stage.func(item)
+            except Exception as e:
+                print(f"❌ {stage.name} failed: {e}")
+                result = None
+                with stage._lock:
+                    stage.errors += 1
+            stage.add_time(busy=time.monotonic() - started)
+
+            with stage._lock:
+                stage.items += 1
+                if result is None:
+                    stage.dropped += 1
+            if result is not None and outbox is not None:
+                started = time.monotonic()
+                outbox.put(result)
+                stage.add_time(blocked=time.monotonic() - started)
+
+        # The last worker of a stage tells every worker downstream to finish
+        with stage._lock:
+            remaining[stage.name] -= 1
+            last = remaining[stage.name] == 0
+        if last and outbox is not None:
+            for _ in range(self.next_workers[stage.name]):
+                outbox.put(_DONE)
+
+    def run(self, items):
+        """Push items through every stage; returns per-stage metrics"""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        remaining = {stage.name: stage.workers for stage in self.stages}
+        self.next_workers = {stage.name: (self.stages[i + 1].workers if i + 1 < len(self.stages) else 0)
+                             for i, stage in enumerate(self.stages)}
+
+        process_workers = sum(stage.workers for stage in self.stages if stage.processes)
+        # Worker processes start while other stages' threads are mid-request; forking
+        # a multithreaded process can deadlock, so start them from a clean server
+        pool = (ProcessPoolExecutor(max_workers=process_workers,
+                                    mp_context=multiprocessing.get_context("forkserver"))
+                if process_workers else None)
+
+        started = time.monotonic()
+        threads = []
+        try:
+            for i, stage in enumerate(self.stages):
+                outbox = queues[i + 1] if i + 1 < len(self.stages) else None
+                for n in range(stage.workers):
+                    thread = threading.Thread(
+                        target=self._worker, name=f"{stage.name}-{n}", daemon=True,
+                        args=(stage, queues[i], outbox, pool if stage.processes else None, remaining))
+                    thread.start()
+                    threads.append(thread)
+
+            # Feeding blocks too once the first stage falls behind
+            for item in items:
+                queues[0].put(item)
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+
+            for thread in threads:
+                thread.join()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self.wall_seconds = time.monotonic() - started
+        return self.metrics()
+
+    def metrics(self):
+        return [stage.metrics(self.wall_seconds) for stage in self.stages]
+
+    def report(self):
+        metrics = self.metrics()
+        print(f"📈 Pipeline stages (wall {self.wall_seconds:.1f}s, queue size {self.queue_size}):")
+        for m in metrics:
+            print(f"   {m['stage']:<12} {m['workers']:>2} workers {m['items']:>5} items  "
+                  f"busy {m['utilization']:>4.0%}  starved {m['starved']:>4.0%}  "
+                  f"blocked {m['blocked']:>4.0%}  errors {m['errors']}")
+        if metrics and self.wall_seconds > 0:
+            bottleneck = max(metrics, key=lambda m: m['utilization'])
+            print(f"   ⛔ Limiting stage: {bottleneck['stage']}")
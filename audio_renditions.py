@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Slow renditions - pitch-preserving slowed-down copies of word and letter clips
+
+Each rendition is derived locally from the clip already on disk (ffmpeg's
+atempo filter stretches time without changing pitch), so "say it slower"
+costs no API characters. Renditions are recorded under their clip's manifest
+entry and re-derived whenever the clip itself changes. Only renditions made
+from a clip's current file are bundled or published; when they can't be
+re-derived the stale ones are deleted and the game slows the clip down itself.
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+from audio_manifest import file_digest, record_rendition
+from audio_pipeline import Pipeline, Stage
+
+SLOW_SPEEDS = (0.75, 0.9)
+SLOW_CATEGORIES = ("word", "letter")
+
+
+def rendition_path(output_path, speed):
+    """audio/words/her.mp3 at 0.75x -> audio/words/slow-75/her.mp3"""
+    output_path = Path(output_path)
+    return str(output_path.parent / f"slow-{round(speed * 100)}" / output_path.name)
+
+
+def is_rendition_path(path):
+    """True for files under a slow-NN directory"""
+    return Path(path).parent.name.startswith("slow-")
+
+
+def current_renditions(manifest):
+    """Recorded rendition paths derived from their clip's current file"""
+    return {rendition['path']
+            for entry in manifest['clips'].values()
+            for rendition in entry.get('renditions', {}).values()
+            if rendition['source_sha256'] == entry.get('sha256')}
+
+
+def stretch_clip(job):
+    """Time-stretch one clip and re-encode it (runs in a worker process)"""
+    staging_path = job['rendition_path'] + '.tmp'
+    Path(staging_path).parent.mkdir(parents=True, exist_ok=True)
+    result = subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", job['output_path'],
+         "-af", f"atempo={job['speed']}", "-codec:a", "libmp3lame", "-q:a", "2",
+         "-f", "mp3", staging_path],
+        capture_output=True, text=True)
+    if result.returncode != 0:
+        Path(staging_path).unlink(missing_ok=True)
+        raise RuntimeError(f"ffmpeg could not slow down {job['output_path']}: {result.stderr.strip()}")
+    os.replace(staging_path, job['rendition_path'])
+
+    job['sha256'] = file_digest(job['rendition_path'])
+    job['bytes'] = os.path.getsize(job['rendition_path'])
+    return job
+
+
+def stale_renditions(manifest, speeds=SLOW_SPEEDS, categories=SLOW_CATEGORIES):
+    """Renditions that are missing or were derived from an older version of their clip"""
+    jobs = []
+    for output_path, entry in sorted(manifest['clips'].items()):
+        if entry['category'] not in categories or not Path(output_path).exists():
+            continue
+        for speed in speeds:
+            path = rendition_path(output_path, speed)
+            rendition = entry.get('renditions', {}).get(f"{speed:g}")
+            if (rendition is None or rendition['source_sha256'] != entry['sha256']
+                    or not Path(path).exists()):
+                jobs.append({"output_path": output_path, "speed": speed, "rendition_path": path})
+    return jobs
+
+
+def remove_renditions(output_path, speeds=SLOW_SPEEDS):
+    """Delete the rendition files of a clip that no longer exists"""
+    for speed in speeds:
+        Path(rendition_path(output_path, speed)).unlink(missing_ok=True)
+
+
+def remove_stale_renditions(manifest, jobs):
+    """Delete renditions that can't be re-derived; returns the paths that were removed"""
+    removed = []
+    for job in jobs:
+        renditions = manifest['clips'][job['output_path']].get('renditions', {})
+        recorded = renditions.pop(f"{job['speed']:g}", None)
+        if recorded is not None or Path(job['rendition_path']).exists():
+            Path(job['rendition_path']).unlink(missing_ok=True)
+            removed.append(job['rendition_path'])
+    return removed
+
+
+def derive_renditions(manifest, speeds=SLOW_SPEEDS, categories=SLOW_CATEGORIES, workers=None,
+                      queue_size=8):
+    """Derive every stale rendition in a process pool; returns the rendition paths written or removed"""
+    jobs = stale_renditions(manifest, speeds, categories)
+    if not jobs:
+        return []
+    if not shutil.which("ffmpeg"):
+        # An outdated rendition would play the previous recording, so drop it
+        removed = remove_stale_renditions(manifest, jobs)
+        print(f"⚠️  ffmpeg not found, skipping {len(jobs)} slow renditions and removing "
+              f"{len(removed)} outdated ones (the game will slow clips down itself)")
+        return removed
+
+    derived = []
+
+    def publish(job):
+        record_rendition(manifest, job['output_path'], job['speed'], job['rendition_path'],
+                         sha256=job['sha256'], size=job['bytes'])
+        derived.append(job['rendition_path'])
+        return job
+
+    pipeline = Pipeline([
+        Stage("stretch", stretch_clip, workers=workers or min(4, os.cpu_count() or 1), processes=True),
+        Stage("record", publish),
+    ], queue_size=queue_size)
+    pipeline.run(jobs)
+    pipeline.report()
+    print(f"🐢 Derived {len(derived)} of {len(jobs)} slow renditions")
+    return derived
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Build per-level content packs for the game
+
+Each level gets packs/level-N/content.json (words, stories, a precomputed
+distractor table and an index into the audio bundle) plus one audio bundle
+holding that level's word and story clips. The game loads only the active
+level's pack.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from audio_manifest import load_manifest
+from audio_renditions import SLOW_SPEEDS, current_renditions, rendition_path
+from build_distractors import SEED_DISTRACTORS, build_distractor_table, real_word_distractors
+
+PACKS_DIR = Path("packs")
+PACK_VERSION = 1
+
+
+def level_clips(words):
+    """Audio paths bundled with a level, in bundle order"""
+    paths = []
+    for word in words:
+        paths.append(f"audio/words/{word}.mp3")
+        paths.append(f"audio/sentences/{word}-story.mp3")
+    return paths
+
+
+def level_renditions(words):
+    """Slow renditions bundled with a level when they are current"""
+    return [rendition_path(f"audio/words/{word}.mp3", speed) for word in words for speed in SLOW_SPEEDS]
+
+
+def write_if_changed(path, data):
+    """Atomically write bytes unless the file already holds them; returns True if written"""
+    path = Path(path)
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def encode_json(data):
+    return (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+class ContentPackBuilder:
+    def __init__(self, levels, stories, seeds=SEED_DISTRACTORS, output_dir=PACKS_DIR, manifest=None):
+        self.levels = levels
+        self.stories = stories
+        self.seeds = seeds
+        self.output_dir = Path(output_dir)
+        # Decides which renditions are current; loaded from disk unless a build passes its own
+        self.manifest = manifest
+        self._distractors = None
+
+    @property
+    def distractors(self):
+        """Distractor table over every level, so neighbours from other levels count too"""
+        if self._distractors is None:
+            words = [word for level in sorted(self.levels) for word in self.levels[level]]
+            distractors = build_distractor_table(words, seeds=self.seeds)
+            # Guard against a change to the rules or seeds letting real words through
+            leaked = real_word_distractors(distractors)
+            if leaked:
+                raise ValueError("Real words offered as distractors: " + "; ".join(
+                    f"{word}: {', '.join(real)}" for word, real in sorted(leaked.items())))
+            self._distractors = distractors
+        return self._distractors
+
+    @classmethod
+    def from_sources(cls, output_dir=PACKS_DIR):
+        """Builder fed from the content defined in the generator scripts"""
+        from generate_high_quality_audio import LEVELS
+        from generate_word_stories_audio import WORD_STORIES
+
+        return cls(LEVELS, WORD_STORIES, output_dir=output_dir)
+
+    def level_for_path(self, output_path):
+        """Level whose bundle contains an audio path, or None"""
+        for level, words in self.levels.items():
+            if output_path in level_clips(words) or output_path in level_renditions(words):
+                return level
+        return None
+
+    def build_bundle(self, level_dir, words):
+        """Concatenate the level's clips into one content-addressed bundle.
+
+        Returns (bundle file name, {audio path: [offset, length]}).
+        """
+        chunks, index, offset = [], {}, 0
+        if self.manifest is None:
+            self.manifest = load_manifest()
+        # A rendition left over from an older recording of its clip would play the wrong audio
+        current = current_renditions(self.manifest)
+        renditions = [path for path in level_renditions(words) if path in current and Path(path).exists()]
+        for output_path in level_clips(words) + renditions:
+            if not Path(output_path).exists():
+                print(f"⚠️  Missing audio, level will fall back to speech: {output_path}")
+                continue
+            data = Path(output_path).read_bytes()
+            chunks.append(data)
+            index[output_path] = [offset, len(data)]
+            offset += len(data)
+
+        bundle = b''.join(chunks)
+        bundle_name = f"audio-{hashlib.sha256(bundle).hexdigest()[:12]}.bin"
+        if write_if_changed(level_dir / bundle_name, bundle):
+            print(f"📦 Wrote {level_dir / bundle_name} ({len(bundle) / 1024:.1f} KB)")
+
+        # Bundles are named by content, so older ones can go once the new one is in place
+        for old_bundle in level_dir.glob("audio-*.bin"):
+            if old_bundle.name != bundle_name:
+                old_bundle.unlink()
+        return bundle_name, index
+
+    def level_inputs(self, level):
+        """Everything a level's content.json is built from apart from its audio"""
+        words = self.levels[level]
+        return {
+            "version": PACK_VERSION,
+            "level": level,
+            "words": words,
+            "stories": {word: self.stories[word] for word in words if word in self.stories},
+            "distractors": {word: self.distractors[word] for word in words}
+        }
+
+    def level_fingerprint(self, level):
+        inputs = json.dumps(self.level_inputs(level), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(inputs.encode('utf-8')).hexdigest()
+
+    def stale_levels(self):
+        """Levels whose words, stories or distractors differ from what their pack was built from.
+
+        Moving a word between levels changes both levels, and adding a word can
+        change the distractors of every level, without any audio changing.
+        """
+        stale = []
+        for level in sorted(self.levels):
+            content_path = self.output_dir / f"level-{level}" / "content.json"
+            try:
+                with open(content_path, 'r', encoding='utf-8') as f:
+                    built_from = json.load(f).get('fingerprint')
+            except (OSError, ValueError):
+                built_from = None
+            if built_from != self.level_fingerprint(level):
+                stale.append(level)
+        return stale
+
+    def build_level(self, level):
+        words = self.levels[level]
+        level_dir = self.output_dir / f"level-{level}"
+        bundle_name, audio_index = self.build_bundle(level_dir, words)
+
+        content = dict(self.level_inputs(level))
+        content.update({
+            "fingerprint": self.level_fingerprint(level),
+            "bundle": bundle_name,
+            "audio": audio_index
+        })
+        if write_if_changed(level_dir / "content.json", encode_json(content)):
+            print(f"📝 Wrote {level_dir / 'content.json'}")
+
+    def build(self, levels=None):
+        """Build the given levels (default: all) and refresh the pack index"""
+        levels = sorted(self.levels) if levels is None else sorted(levels)
+        unknown = [level for level in levels if level not in self.levels]
+        if unknown:
+            raise ValueError(f"Unknown levels: {unknown}")
+        for level in levels:
+            self.build_level(level)
+
+        index = {
+            "version": PACK_VERSION,
+            "levels": [
+                {
+                    "level": level,
+                    "words": len(self.levels[level]),
+                    "content": f"level-{level}/content.json"
+                }
+                for level in sorted(self.levels)
+            ]
+        }
+        write_if_changed(self.output_dir / "index.json", encode_json(index))
+
+        # Levels that no longer exist
+        for level_dir in self.output_dir.glob("level-*"):
+            if level_dir.name not in {f"level-{level}" for level in self.levels}:
+                for path in level_dir.iterdir():
+                    path.unlink()
+                level_dir.rmdir()
+                print(f"🗑️  Removed {level_dir}")
+        return levels
+
+    def rebuild_affected(self, manifest, catalog, changed, removed):
+        """Downstream build stage: rebuild only the packs whose audio or other inputs changed"""
+        levels = {self.level_for_path(output_path) for output_path in list(changed) + list(removed)}
+        levels.discard(None)
+        levels.update(self.stale_levels())
+        self.manifest = manifest
+        # Always refresh the index too, which drops packs for levels that no longer exist
+        self.build(levels)
+
+
+def main():
+    print("📚 Sight Words Content Pack Builder 📚")
+    print("=" * 50)
+
+    builder = ContentPackBuilder.from_sources()
+    levels = builder.build()
+    print(f"✅ Built {len(levels)} content packs in {builder.output_dir}/")
+
+
+if __name__ == "__main__":
+    main()
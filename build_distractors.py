@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Generate plausible misspellings for every sight word
+
+Candidates come from phonetic spelling rules (how children actually misspell
+sight words: "come" -> "cum", "said" -> "sed") and small edits (swapped
+letters, wrong vowel, dropped or doubled letter). Phonetic candidates go into
+BK-trees, one per first letter, so each word's nearest misspellings - including
+ones generated from other words - are found without comparing against the
+whole pool.
+"""
+
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# Hand-written misspellings the game shipped with; kept as extra candidates
+SEED_DISTRACTORS = [
+    'air', 'our', 'doze', 'dose', 'form', 'fro', 'boat', 'bath', 'off', 'if',
+    'you', 'yore', 'went', 'wont', 'ant', 'and', 'the', 'is', 'it', 'in',
+    'him', 'how', 'sum', 'oat', 'abut', 'to', 'toe', 'wear', 'whet', 'came',
+    'cums', 'cuming', 'becum', 'becums', 'becuming', 'thair', 'know', 'sow',
+    'allso', 'now', 'ware', 'hear', 'thare', 'eny', 'enywhere', 'enyone', 'enything',
+    'meny', 'frunt', 'vary', 'evry', 'evrywhere', 'evryone', 'evrything', 'cud',
+    'wud', 'shud', 'wen', 'wich', 'bean', 'sed', 'ech', 'askd', 'wy', 'bi',
+    'mi', 'tri', 'poot', 'pooting', 'onely', 'werk', 'werd', 'werld'
+]
+
+# (spelling, how it gets written by ear)
+PHONETIC_RULES = [
+    ('ome', 'um'), ('one', 'un'), ('o', 'u'), ('ou', 'u'), ('ou', 'ow'), ('ou', 'oa'),
+    ('ow', 'ou'), ('wh', 'w'), ('wh', 'h'), ('ei', 'ai'), ('ere', 'are'), ('ere', 'air'),
+    ('ere', 'ear'), ('ould', 'ud'), ('ould', 'ood'), ('ai', 'e'), ('ea', 'e'), ('ee', 'ea'),
+    ('ed', 'd'), ('ed', 't'), ('er', 'ur'), ('or', 'er'), ('y', 'i'), ('y', 'ie'),
+    ('a', 'e'), ('e', 'a'), ('u', 'oo'), ('ck', 'k'), ('ph', 'f'), ('ie', 'ei'),
+    ('ch', 'tch'), ('c', 'k'), ('s', 'z'), ('ve', 'v'), ('th', 'f'), ('tt', 't'),
+]
+
+# Real words that sound like a sight word; offering one would make the spoken answer ambiguous
+HOMOPHONES = {
+    'to', 'hear', 'know', 'sum', 'sew', 'sow', 'buy', 'bye', 'wood', 'witch',
+    'ware', 'wear', 'heir', 'won'
+}
+
+# Real words the spelling rules and edits can produce ("put" -> "pat", "come" -> "cum");
+# offered as misspellings they would teach the wrong thing. The shipped list holds base
+# forms with no length cap; a system dictionary adds to it where one is installed
+REAL_WORDS_PATH = Path(__file__).with_name("real_words.txt")
+SYSTEM_WORDS_PATH = Path("/usr/share/dict/words")
+# Irregular past forms in the list; "caming" is a misspelling of "coming", not "came" + ing
+UNINFLECTED = {'came', 'became', 'went', 'was', 'were', 'said', 'did', 'done', 'gone', 'made', 'told'}
+
+VOWELS = 'aeiou'
+# Consonants children double when unsure ("allso"), as opposed to "whhy"
+DOUBLING = 'bcdfglmnprst'
+DEFAULT_LIMIT = 6
+DEFAULT_RADIUS = 2
+
+
+def levenshtein(a, b):
+    """Edit distance between two strings (insert, delete, substitute)"""
+    # Misspellings share most of their letters with the word; only the
+    # differing middle needs the dynamic programme
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree for nearest-neighbour search under edit distance"""
+
+    def __init__(self, distance=levenshtein):
+        self.distance = distance
+        self.root = None
+        self.size = 0
+
+    def add(self, term):
+        if self.root is None:
+            self.root = (term, {})
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            d = self.distance(term, node[0])
+            if d == 0:
+                return
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = (term, {})
+                self.size += 1
+                return
+            node = child
+
+    def search(self, term, radius):
+        """Every (distance, term) within radius, by the triangle inequality"""
+        if self.root is None:
+            return []
+        results, stack = [], [self.root]
+        while stack:
+            node_term, children = stack.pop()
+            d = self.distance(term, node_term)
+            if d <= radius:
+                results.append((d, node_term))
+            for edge, child in children.items():
+                if d - radius <= edge <= d + radius:
+                    stack.append(child)
+        return results
+
+
+def _apply_rules(word):
+    """Every spelling reachable with one phonetic rule applied at one position"""
+    variants = set()
+    for spelling, written in PHONETIC_RULES:
+        start = word.find(spelling)
+        while start != -1:
+            variants.add(word[:start] + written + word[start + len(spelling):])
+            start = word.find(spelling, start + 1)
+    return variants
+
+
+def phonetic_variants(word):
+    """Misspellings from one or two phonetic rules ("where" -> "ware")"""
+    first = _apply_rules(word)
+    variants = set(first)
+    for variant in first:
+        variants |= _apply_rules(variant)
+    variants.discard(word)
+    return variants
+
+
+def edit_variants(word):
+    """Single-edit misspellings that keep the first letter, which children rarely get wrong"""
+    variants = set()
+    for i in range(1, len(word)):
+        if word[i] in VOWELS:
+            for vowel in VOWELS:
+                variants.add(word[:i] + vowel + word[i + 1:])
+        if i < len(word) - 1:
+            variants.add(word[:i] + word[i + 1] + word[i] + word[i + 2:])
+        if len(word) > 3:
+            variants.add(word[:i] + word[i + 1:])
+        if (len(word) > 3 and word[i] in DOUBLING and word[i] != word[i - 1]
+                and i < len(word) - 1):
+            variants.add(word[:i] + word[i] + word[i:])
+    variants.discard(word)
+    return variants
+
+
+@lru_cache(maxsize=None)
+def load_real_words():
+    """Known words from real_words.txt plus the system dictionary, lower-cased"""
+    words = set()
+    for path in (REAL_WORDS_PATH, SYSTEM_WORDS_PATH):
+        if not path.exists():
+            continue
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            words.update(line.strip().lower() for line in f
+                         if line.strip() and not line.startswith('#'))
+    return frozenset(words)
+
+
+def inflections(word):
+    """Regular -s, -ed and -ing forms of a word ("pat" -> "pats", "patted", "patting")"""
+    if re.search(r'(s|x|z|ch|sh)$', word):
+        forms = {word + 'es'}
+    elif re.search(r'[^aeiou]y$', word):
+        forms = {word[:-1] + 'ies'}
+    else:
+        forms = {word + 's'}
+    if word.endswith('e') and not word.endswith('ee'):
+        forms |= {word[:-1] + 'ing', word + 'd'}
+    elif re.fullmatch(r'[^aeiou]*[aeiou][^aeiouwxy]', word):
+        # Short consonant-vowel-consonant words double their last letter
+        forms |= {word + word[-1] + 'ing', word + word[-1] + 'ed'}
+    elif re.search(r'[^aeiou]y$', word):
+        forms |= {word + 'ing', word[:-1] + 'ied'}
+    else:
+        forms |= {word + 'ing', word + 'ed'}
+    return forms
+
+
+def is_real_word(candidate, known=None):
+    """True for a known word or a regular inflection of one ("patting")"""
+    known = load_real_words() if known is None else known
+    if candidate in known:
+        return True
+    stems = set()
+    for suffix, endings in (('ing', ('', 'e')), ('ed', ('', 'e')), ('ied', ('y',)), ('ies', ('y',)),
+                            ('es', ('',)), ('s', ('',)), ('d', ('',))):
+        if candidate.endswith(suffix) and len(candidate) > len(suffix) + 1:
+            stem = candidate[:-len(suffix)]
+            stems.update(stem + ending for ending in endings)
+            if len(stem) > 2 and stem[-1] == stem[-2]:
+                stems.add(stem[:-1])
+    return any(stem in known and stem not in UNINFLECTED and len(stem) > 2
+               and candidate in inflections(stem) for stem in stems)
+
+
+def real_word_distractors(table):
+    """{word: distractors that are real words}; empty for a clean table"""
+    leaked = {}
+    for word, distractors in table.items():
+        real = [candidate for candidate in distractors if is_real_word(candidate)]
+        if real:
+            leaked[word] = real
+    return leaked
+
+
+def _plausible(candidate):
+    """Filter out spellings no child would produce"""
+    if len(candidate) < 2 or not candidate.isalpha():
+        return False
+    if not any(letter in VOWELS + 'y' for letter in candidate):
+        return False
+    return not any(candidate[i] == candidate[i + 1] == candidate[i + 2]
+                   for i in range(len(candidate) - 2))
+
+
+def build_distractor_table(words, seeds=SEED_DISTRACTORS, limit=DEFAULT_LIMIT,
+                           radius=DEFAULT_RADIUS):
+    """Map each word to its `limit` most plausible misspellings.
+
+    Candidates are ranked by how they relate to the word:
+      0 - its own phonetic misspellings that keep the first letter
+      1 - its own phonetic misspellings that change the first letter ("any" -> "eny")
+      2 - single edits of the word
+      3 - seeds and other words' misspellings that start with the same letter
+    then by edit distance and length difference. For words of three letters or
+    fewer only their own phonetic misspellings may be two edits away. Words from
+    the list and their homophones are never offered, since in Multiple Choice
+    they would be a second correct answer, and neither are other real words
+    (real_words.txt and their regular inflections), which the game would be
+    teaching as misspellings.
+    """
+    words = list(dict.fromkeys(words))
+    excluded = set(words) | HOMOPHONES
+
+    def usable(candidate):
+        return candidate not in excluded and _plausible(candidate) and not is_real_word(candidate)
+
+    phonetic = {word: {candidate for candidate in phonetic_variants(word) if usable(candidate)}
+                for word in words}
+    seeds = {seed for seed in seeds if usable(seed)}
+
+    # Other words' misspellings only matter when they share the first letter,
+    # so one tree per letter keeps every search small
+    trees = {}
+    for candidate in sorted(seeds.union(*phonetic.values())):
+        trees.setdefault(candidate[0], BKTree()).add(candidate)
+
+    table = {}
+    for word in words:
+        best = {}
+
+        def offer(candidate, tier, distance):
+            if distance > 1 and len(word) <= 3 and tier > 1:
+                return
+            rank = (tier, distance, abs(len(candidate) - len(word)), candidate)
+            if candidate not in best or rank < best[candidate]:
+                best[candidate] = rank
+
+        tree = trees.get(word[0])
+        for distance, candidate in (tree.search(word, radius) if tree else []):
+            offer(candidate, 0 if candidate in phonetic[word] else 3, distance)
+        for candidate in phonetic[word]:
+            if candidate[0] != word[0]:
+                distance = levenshtein(word, candidate)
+                if distance <= radius:
+                    offer(candidate, 1, distance)
+        for candidate in edit_variants(word):
+            if usable(candidate):
+                offer(candidate, 2, 1)
+
+        table[word] = [rank[3] for rank in sorted(best.values())[:limit]]
+    return table
+
+
+def main():
+    from sight_words import main as cli_main
+
+    sys.exit(cli_main(["distractors"] + sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,12 @@ class SightWordsGame {
         this.isGameActive = false;
         this.isFirstFlashCard = true; // Track if this is the first flash card flip
         
+        // Per-level content packs built by build_content_packs.py; the lists below are
+        // the built-in fallback used until (or if) a pack loads, e.g. from file://
+        this.packsUrl = 'packs';
+        this.levels = [];
+        this.level = parseInt(localStorage.getItem('sight-words-level'), 10) || 1;
+        
         this.wordBank = [
             'her', 'who', 'some', 'out', 'about', 'too', 'two', 'were', 'what', 'come', 'comes', 'coming', 'become', 'becomes', 'becoming',
             'their', 'no', 'so', 'also', 'how', 'now', 'where', 'here', 'there', 'any', 'anywhere', 'anyone', 'anything',
@@ -28,6 +34,7 @@ class SightWordsGame {
             'wud', 'shud', 'wen', 'wich', 'bean', 'sed', 'ech', 'askd', 'wy', 'bi',
             'mi', 'tri', 'poot', 'pooting', 'onely', 'werk', 'werd', 'werld'
         ];
+        this.distractorTable = {}; // word -> misspellings, from the active content pack
         
         // Enhanced learning features
         this.wordStories = {
@@ -431,6 +438,76 @@ class SightWordsGame {
         this.updateProgressDisplay();
         this.populateWordTags();
         this.showScreen('welcome');
+        this.loadLevelIndex();
+    }
+
+    async loadLevelIndex() {
+        try {
+            const response = await fetch(`${this.packsUrl}/index.json`);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            const index = await response.json();
+            this.levels = index.levels || [];
+            if (this.levels.length === 0) return;
+
+            this.populateLevelSelect();
+            const active = this.levels.find(entry => entry.level === this.level) || this.levels[0];
+            await this.loadLevel(active.level);
+        } catch (error) {
+            console.log('Content packs unavailable, using built-in word list:', error.message);
+        }
+    }
+
+    // Load only the selected level's words, stories and distractors (and its audio bundle)
+    async loadLevel(level) {
+        const entry = this.levels.find(item => item.level === level);
+        if (!entry) return;
+
+        try {
+            const response = await fetch(`${this.packsUrl}/${entry.content}`);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            const pack = await response.json();
+
+            this.level = level;
+            localStorage.setItem('sight-words-level', String(level));
+            this.wordBank = pack.words;
+            this.wordStories = pack.stories;
+            this.distractorTable = pack.distractors || {};
+
+            if (window.progressTracker) {
+                window.progressTracker.setWordBank(pack.words);
+            }
+            this.populateWordTags();
+            this.updateProgressDisplay();
+
+            const levelSelect = document.getElementById('level-select');
+            if (levelSelect) levelSelect.value = String(level);
+
+            // The audio bundle loads in the background; until it arrives clips play from audio/
+            if (window.audioController) {
+                const packDir = entry.content.substring(0, entry.content.lastIndexOf('/'));
+                window.audioController.loadPack(pack, `${this.packsUrl}/${packDir}`).catch(error => {
+                    console.warn(`Audio bundle for level ${level} unavailable:`, error.message);
+                });
+            }
+        } catch (error) {
+            console.warn(`Failed to load level ${level}:`, error.message);
+        }
+    }
+
+    populateLevelSelect() {
+        const container = document.getElementById('level-select-container');
+        const levelSelect = document.getElementById('level-select');
+        if (!container || !levelSelect) return;
+
+        levelSelect.innerHTML = '';
+        this.levels.forEach(entry => {
+            const option = document.createElement('option');
+            option.value = String(entry.level);
+            option.textContent = `Level ${entry.level} (${entry.words} words)`;
+            levelSelect.appendChild(option);
+        });
+        levelSelect.onchange = () => this.loadLevel(parseInt(levelSelect.value, 10));
+        container.hidden = false;
     }
 
     populateWordTags() {
@@ -677,6 +754,7 @@ class SightWordsGame {
         
         // Generate adaptive word list prioritizing difficult words
         this.wordList = this.generateAdaptiveWordList();
+        this.lastSpokenWord = null;
         
         // Validate word list
         if (!this.wordList || this.wordList.length === 0) {
@@ -1532,8 +1610,15 @@ class SightWordsGame {
             return;
         }
         
-        console.log('Speaking word:', currentWord);
-        window.audioController.speakWord(currentWord).catch(error => {
+        // Replaying the same word says it slower each time, down to the slowest rendition
+        const replays = currentWord === this.lastSpokenWord ? this.wordReplays + 1 : 0;
+        this.lastSpokenWord = currentWord;
+        this.wordReplays = replays;
+        const slowSpeeds = window.audioController.slowSpeeds;
+        const speed = replays > 0 ? slowSpeeds[Math.min(replays, slowSpeeds.length) - 1] : 1;
+
+        console.log('Speaking word:', currentWord, speed !== 1 ? `at ${speed}x` : '');
+        window.audioController.speakWord(currentWord, null, speed).catch(error => {
             console.error('Error speaking word:', error);
         });
     }
@@ -1931,17 +2016,21 @@ class SightWordsGame {
         const finalCurrentWord = this.wordList[this.currentWordIndex];
         const choices = [finalCurrentWord];
         
-        // Add distractor words
-        const distractors = this.distractorWords.filter(word => 
-            word.length === finalCurrentWord.length && word !== finalCurrentWord
-        );
+        // Precomputed misspellings from the level's content pack (build_distractors.py);
+        // the built-in list is only scanned when the pack has too few for this word
+        let distractors = [...(this.distractorTable[finalCurrentWord] || [])];
+        if (distractors.length < 3) {
+            distractors.push(...this.distractorWords.filter(word => 
+                word.length === finalCurrentWord.length && word !== finalCurrentWord &&
+                !distractors.includes(word)
+            ));
+        }
         
         // Shuffle and take 2-3 distractors
-        const shuffledDistractors = distractors.sort(() => Math.random() - 0.5);
-        choices.push(...shuffledDistractors.slice(0, 3));
+        choices.push(...this.shuffleArray(distractors).slice(0, 3));
         
         // Shuffle all choices
-        const shuffledChoices = choices.sort(() => Math.random() - 0.5);
+        const shuffledChoices = this.shuffleArray(choices);
         
         const choiceArea = document.getElementById('choice-options');
         choiceArea.innerHTML = '';
@@ -1954,6 +2043,15 @@ class SightWordsGame {
         });
     }
 
+    // Fisher-Yates shuffle (in place); unbiased, unlike sort(() => Math.random() - 0.5)
+    shuffleArray(items) {
+        for (let i = items.length - 1; i > 0; i--) {
+            const j = Math.floor(Math.random() * (i + 1));
+            [items[i], items[j]] = [items[j], items[i]];
+        }
+        return items;
+    }
+
     selectMultipleChoice(selectedWord) {
         const correctWord = this.wordList[this.currentWordIndex];
         const isCorrect = selectedWord === correctWord;
@@ -2266,6 +2364,7 @@ class SightWordsGame {
         
         // End progress tracking session
         const sessionSummary = window.progressTracker.endSession();
+        window.progressTracker.syncProgress();
         
         // Show results
         this.showResults(sessionSummary);
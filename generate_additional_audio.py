@@ -5,25 +5,55 @@ Generate additional audio files for dynamic phrases used in the game
 
 import os
 import sys
-import requests
 import json
 import time
 from pathlib import Path
 
+VOICE_ID = "EXAVITQu4vr4xnSDxMaL"  # Sarah voice (clear woman's voice)
+MODEL_ID = "eleven_monolingual_v1"  # High quality model
+
+# Audio settings optimized for children's learning - slower and clearer
+VOICE_SETTINGS = {
+    "stability": 0.75,     # More consistent pronunciation
+    "similarity_boost": 0.9,  # Maximum clarity for children
+    "style": 0.0,         # Neutral style
+    "use_speaker_boost": True
+}
+
+DYNAMIC_PHRASES = {
+    # Game instructions
+    "welcome-spelling": "Welcome to the Spelling Challenge! Listen to the word and type it in the box. Click the speaker button if you need to hear the word again.",
+    "welcome-scramble": "Welcome to Letter Scramble! Listen to the word and arrange the letters in the correct order. Click the speaker button if you need to hear the word again.",
+    "welcome-multiple-choice": "Welcome to Multiple Choice! Listen to the word and click on the correct spelling. Click the speaker button if you need to hear the word again.",
+    "welcome-flashcards": "Welcome to Flash Cards! Look at the word and listen to help you remember it. Click 'Show Next Card' when you're ready.",
+    "welcome-reading-practice": "Welcome to Reading Practice! Look at the word and try to say it out loud. If you get it wrong, you'll hear the correct pronunciation to help you learn.",
+    
+    # Dynamic feedback phrases
+    "good-try-template": "Good try! I heard you say",
+    "but-the-word-is": "but the word is",
+    "look-at-word-template": "Look at the word and listen to help you remember it. The word is",
+    "click-speaker-to-hear": "Click the speaker button to hear the word",
+    
+    # Common error messages
+    "didnt-hear-anything": "I didn't hear anything. Please speak clearly and try again!",
+    "speech-not-supported": "Speech recognition is not supported on this device. Please use the speaker button to hear the word.",
+}
+
+
+def dynamic_phrase_clips():
+    """(text, output_path) pairs for every dynamic phrase"""
+    return [(text, f"audio/phrases/{key}.mp3") for key, text in DYNAMIC_PHRASES.items()]
+
+
 class AdditionalAudioGenerator:
     def __init__(self, api_key=None):
         self.api_key = api_key or os.getenv('ELEVENLABS_API_KEY')
+        # HTTP status of the latest request per output path (None after a network error)
+        self.statuses = {}
         self.base_url = "https://api.elevenlabs.io/v1"
-        self.voice_id = "EXAVITQu4vr4xnSDxMaL"  # Sarah voice (clear woman's voice)
-        self.model_id = "eleven_monolingual_v1"  # High quality model
-        
-        # Audio settings optimized for children's learning - slower and clearer
-        self.voice_settings = {
-            "stability": 0.75,     # More consistent pronunciation
-            "similarity_boost": 0.9,  # Maximum clarity for children
-            "style": 0.0,         # Neutral style
-            "use_speaker_boost": True
-        }
+        self.voice_id = VOICE_ID
+        self.model_id = MODEL_ID
+        self.voice_settings = dict(VOICE_SETTINGS)
         
         if not self.api_key:
             print("❌ Error: ElevenLabs API key not found!")
@@ -31,6 +61,9 @@ class AdditionalAudioGenerator:
 
     def generate_audio(self, text, output_path):
         """Generate high-quality audio using ElevenLabs API"""
+        # Imported here so that loading the content catalog stays cheap
+        import requests
+
         try:
             url = f"{self.base_url}/text-to-speech/{self.voice_id}"
             
@@ -47,6 +80,7 @@ class AdditionalAudioGenerator:
             }
             
             response = requests.post(url, json=data, headers=headers)
+            self.statuses[output_path] = response.status_code
             
             if response.status_code == 200:
                 with open(output_path, 'wb') as f:
@@ -59,29 +93,13 @@ class AdditionalAudioGenerator:
                 return False
                 
         except Exception as e:
+            self.statuses[output_path] = None
             print(f"❌ Error generating {output_path}: {e}")
             return False
 
     def generate_dynamic_phrases(self):
         """Generate audio for dynamic phrases used in the game"""
-        phrases = {
-            # Game instructions
-            "welcome-spelling": "Welcome to the Spelling Challenge! Listen to the word and type it in the box. Click the speaker button if you need to hear the word again.",
-            "welcome-scramble": "Welcome to Letter Scramble! Listen to the word and arrange the letters in the correct order. Click the speaker button if you need to hear the word again.",
-            "welcome-multiple-choice": "Welcome to Multiple Choice! Listen to the word and click on the correct spelling. Click the speaker button if you need to hear the word again.",
-            "welcome-flashcards": "Welcome to Flash Cards! Look at the word and listen to help you remember it. Click 'Show Next Card' when you're ready.",
-            "welcome-reading-practice": "Welcome to Reading Practice! Look at the word and try to say it out loud. If you get it wrong, you'll hear the correct pronunciation to help you learn.",
-            
-            # Dynamic feedback phrases
-            "good-try-template": "Good try! I heard you say",
-            "but-the-word-is": "but the word is",
-            "look-at-word-template": "Look at the word and listen to help you remember it. The word is",
-            "click-speaker-to-hear": "Click the speaker button to hear the word",
-            
-            # Common error messages
-            "didnt-hear-anything": "I didn't hear anything. Please speak clearly and try again!",
-            "speech-not-supported": "Speech recognition is not supported on this device. Please use the speaker button to hear the word.",
-        }
+        phrases = dynamic_phrase_clips()
         
         print("🎵 Generating dynamic phrase audio files...")
         success_count = 0
@@ -90,8 +108,8 @@ class AdditionalAudioGenerator:
         phrases_dir = Path("audio/phrases")
         phrases_dir.mkdir(parents=True, exist_ok=True)
         
-        for key, text in phrases.items():
-            output_path = phrases_dir / f"{key}.mp3"
+        for text, output_path in phrases:
+            output_path = Path(output_path)
             if not output_path.exists():
                 if self.generate_audio(text, output_path):
                     success_count += 1
@@ -6,25 +6,104 @@ Uses ElevenLabs API for premium TTS quality
 
 import os
 import sys
-import requests
 import json
 import time
 from pathlib import Path
 
+VOICE_ID = "EXAVITQu4vr4xnSDxMaL"  # Sarah voice (clear woman's voice)
+MODEL_ID = "eleven_monolingual_v1"  # High quality model
+
+# Audio settings optimized for children's learning - slower and clearer
+VOICE_SETTINGS = {
+    "stability": 0.75,     # More consistent pronunciation
+    "similarity_boost": 0.9,  # Maximum clarity for children
+    "style": 0.0,         # Neutral style
+    "use_speaker_boost": True
+}
+
+# Sight words grouped by level; each level ships to the game as its own content pack
+LEVELS = {
+    1: ['her', 'who', 'some', 'out', 'about', 'too', 'two', 'were', 'what', 'come',
+        'comes', 'coming', 'become', 'becomes', 'becoming'],
+    2: ['their', 'no', 'so', 'also', 'how', 'now', 'where', 'here', 'there', 'any',
+        'anywhere', 'anyone', 'anything'],
+    3: ['many', 'front', 'very', 'every', 'everywhere', 'everyone', 'everything', 'could',
+        'would', 'should'],
+    4: ['when', 'which', 'been', 'said', 'each', 'asked', 'why', 'by', 'my', 'try', 'put',
+        'putting', 'only', 'work', 'word', 'world'],
+}
+
+WORDS = [word for level in sorted(LEVELS) for word in LEVELS[level]]
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+ENCOURAGEMENTS = [
+    "Great job!",
+    "Excellent work!",
+    "Perfect!",
+    "Amazing!",
+    "Fantastic!",
+    "Wonderful!",
+    "Awesome!",
+    "Correct!",
+    "Nice job!",
+    "Well done!",
+    "Outstanding!",
+    "You got it!"
+]
+
+CORRECTIONS = [
+    "The correct word is",
+    "Try again. The word is",
+    "Not quite. It's",
+    "The word is",
+    "Let's try again. The word is",
+    "Close! The word is"
+]
+
+TEST_MESSAGE = "Hello! This is how I sound. I hope you like my voice!"
+
+
+def word_clips():
+    """(text, output_path) pairs for every sight word - clear, slow pronunciation for children"""
+    return [(f"{word}.", f"audio/words/{word}.mp3") for word in WORDS]
+
+
+def letter_clips():
+    """(text, output_path) pairs for every letter"""
+    return [(f"The letter {letter.upper()}. {letter.upper()}.", f"audio/letters/{letter}.mp3")
+            for letter in LETTERS]
+
+
+def encouragement_clips():
+    """(text, output_path) pairs for the encouraging phrases"""
+    clips = []
+    for encouragement in ENCOURAGEMENTS:
+        filename = encouragement.lower().replace('!', '').replace(' ', '-')
+        clips.append((encouragement, f"audio/encouragement/{filename}.mp3"))
+    return clips
+
+
+def correction_clips():
+    """(text, output_path) pairs for the numbered correction phrases"""
+    return [(correction, f"audio/corrections/correction-{i+1}.mp3")
+            for i, correction in enumerate(CORRECTIONS)]
+
+
+def test_clips():
+    """(text, output_path) pair for the voice test clip"""
+    return [(TEST_MESSAGE, "audio/test/hello.mp3")]
+
+
 class HighQualityAudioGenerator:
     def __init__(self, api_key=None):
         self.api_key = api_key or os.getenv('ELEVENLABS_API_KEY')
+        # HTTP status of the latest request per output path (None after a network error)
+        self.statuses = {}
         self.base_url = "https://api.elevenlabs.io/v1"
-        self.voice_id = "EXAVITQu4vr4xnSDxMaL"  # Sarah voice (clear woman's voice)
-        self.model_id = "eleven_monolingual_v1"  # High quality model
-        
-        # Audio settings optimized for children's learning - slower and clearer
-        self.voice_settings = {
-            "stability": 0.75,     # More consistent pronunciation
-            "similarity_boost": 0.9,  # Maximum clarity for children
-            "style": 0.0,         # Neutral style
-            "use_speaker_boost": True
-        }
+        self.voice_id = VOICE_ID
+        self.model_id = MODEL_ID
+        self.voice_settings = dict(VOICE_SETTINGS)
         
         if not self.api_key:
             print("❌ Error: ElevenLabs API key not found!")
@@ -51,6 +130,9 @@ class HighQualityAudioGenerator:
 
     def generate_audio(self, text, output_path, voice_id=None):
         """Generate high-quality audio using ElevenLabs API"""
+        # Imported here so that loading the content catalog stays cheap
+        import requests
+
         try:
             url = f"{self.base_url}/text-to-speech/{voice_id or self.voice_id}"
             
@@ -67,6 +149,7 @@ class HighQualityAudioGenerator:
             }
             
             response = requests.post(url, json=data, headers=headers)
+            self.statuses[output_path] = response.status_code
             
             if response.status_code == 200:
                 with open(output_path, 'wb') as f:
@@ -79,29 +162,19 @@ class HighQualityAudioGenerator:
                 return False
                 
         except Exception as e:
+            self.statuses[output_path] = None
             print(f"❌ Error generating {output_path}: {e}")
             return False
 
     def generate_word_audio(self):
         """Generate audio files for all sight words with optimal pronunciation"""
-        words = [
-            'her', 'who', 'some', 'out', 'about', 'too', 'two', 'were', 'what', 'come', 
-            'comes', 'coming', 'become', 'becomes', 'becoming', 'their', 'no', 'so', 
-            'also', 'how', 'now', 'where', 'here', 'there', 'any', 'anywhere', 'anyone', 
-            'anything', 'many', 'front', 'very', 'every', 'everywhere', 'everyone', 
-            'everything', 'could', 'would', 'should', 'when', 'which', 'been', 'said', 
-            'each', 'asked', 'why', 'by', 'my', 'try', 'put', 'putting', 'only', 'work', 
-            'word', 'world'
-        ]
+        words = word_clips()
         
         print("🎵 Generating high-quality word audio files...")
         success_count = 0
         
-        for i, word in enumerate(words):
-            output_path = f"audio/words/{word}.mp3"
+        for i, (text, output_path) in enumerate(words):
             if not os.path.exists(output_path):
-                # Clear, slow pronunciation for children
-                text = f"{word}."
                 if self.generate_audio(text, output_path):
                     success_count += 1
                 
@@ -117,16 +190,13 @@ class HighQualityAudioGenerator:
 
     def generate_letter_audio(self):
         """Generate audio files for each letter with clear pronunciation"""
-        letters = 'abcdefghijklmnopqrstuvwxyz'
+        letters = letter_clips()
         
         print("🔤 Generating letter audio files...")
         success_count = 0
         
-        for i, letter in enumerate(letters):
-            output_path = f"audio/letters/{letter}.mp3"
+        for i, (text, output_path) in enumerate(letters):
             if not os.path.exists(output_path):
-                # Clear letter pronunciation for children
-                text = f"The letter {letter.upper()}. {letter.upper()}."
                 if self.generate_audio(text, output_path):
                     success_count += 1
                 
@@ -141,27 +211,12 @@ class HighQualityAudioGenerator:
 
     def generate_encouragement_audio(self):
         """Generate encouraging phrases with warm, positive tone"""
-        encouragements = [
-            "Great job!",
-            "Excellent work!",
-            "Perfect!",
-            "Amazing!",
-            "Fantastic!",
-            "Wonderful!",
-            "Awesome!",
-            "Correct!",
-            "Nice job!",
-            "Well done!",
-            "Outstanding!",
-            "You got it!"
-        ]
+        encouragements = encouragement_clips()
         
         print("🎉 Generating encouragement audio files...")
         success_count = 0
         
-        for i, encouragement in enumerate(encouragements):
-            filename = encouragement.lower().replace('!', '').replace(' ', '-')
-            output_path = f"audio/encouragement/{filename}.mp3"
+        for i, (encouragement, output_path) in enumerate(encouragements):
             if not os.path.exists(output_path):
                 if self.generate_audio(encouragement, output_path):
                     success_count += 1
@@ -177,20 +232,12 @@ class HighQualityAudioGenerator:
 
     def generate_correction_audio(self):
         """Generate correction phrases with gentle, helpful tone"""
-        corrections = [
-            "The correct word is",
-            "Try again. The word is",
-            "Not quite. It's",
-            "The word is",
-            "Let's try again. The word is",
-            "Close! The word is"
-        ]
+        corrections = correction_clips()
         
         print("🔄 Generating correction audio files...")
         success_count = 0
         
-        for i, correction in enumerate(corrections):
-            output_path = f"audio/corrections/correction-{i+1}.mp3"
+        for i, (correction, output_path) in enumerate(corrections):
             if not os.path.exists(output_path):
                 if self.generate_audio(correction, output_path):
                     success_count += 1
@@ -206,8 +253,7 @@ class HighQualityAudioGenerator:
 
     def generate_test_audio(self):
         """Generate test audio file"""
-        test_message = "Hello! This is how I sound. I hope you like my voice!"
-        output_path = "audio/test/hello.mp3"
+        test_message, output_path = test_clips()[0]
         
         print("🧪 Generating test audio file...")
         if not os.path.exists(output_path):
@@ -216,25 +262,16 @@ class HighQualityAudioGenerator:
         else:
             print(f"⏭️  Already exists: {output_path}")
 
-    def get_available_voices(self):
-        """Get list of available voices"""
-        try:
-            url = f"{self.base_url}/voices"
-            headers = {"xi-api-key": self.api_key}
-            
-            response = requests.get(url, headers=headers)
-            if response.status_code == 200:
-                voices = response.json()
-                print("Available voices:")
-                for voice in voices['voices']:
-                    print(f"  - {voice['name']} (ID: {voice['voice_id']})")
-                return voices['voices']
-            else:
-                print(f"Failed to get voices: {response.status_code}")
-                return []
-        except Exception as e:
-            print(f"Error getting voices: {e}")
-            return []
+    def get_available_voices(self, refresh=False):
+        """Get list of available voices (cached on disk, see voice_cache.py)"""
+        from voice_cache import get_voices
+
+        voices = get_voices(self.api_key, self.base_url, refresh=refresh)
+        if voices:
+            print("Available voices:")
+            for voice in voices:
+                print(f"  - {voice['name']} (ID: {voice['voice_id']})")
+        return voices
 
 def main():
     """Main function to generate all high-quality audio files"""
@@ -5,25 +5,93 @@ Generate high-quality audio for word stories
 
 import os
 import sys
-import requests
 import json
 import time
 from pathlib import Path
 
+VOICE_ID = "EXAVITQu4vr4xnSDxMaL"  # Sarah voice (clear woman's voice)
+MODEL_ID = "eleven_monolingual_v1"  # High quality model
+
+# Audio settings optimized for children's learning - slower and clearer
+VOICE_SETTINGS = {
+    "stability": 0.75,     # More consistent pronunciation
+    "similarity_boost": 0.9,  # Maximum clarity for children
+    "style": 0.0,         # Neutral style
+    "use_speaker_boost": True
+}
+
+WORD_STORIES = {
+    'her': 'Her name is Sarah.',
+    'who': 'Who is at the door?',
+    'some': 'I have some cookies.',
+    'out': 'Let\'s go out to play.',
+    'about': 'Tell me about your day.',
+    'too': 'I want to go too!',
+    'two': 'I have two cats.',
+    'were': 'We were happy yesterday.',
+    'what': 'What is your favorite color?',
+    'come': 'Come here, please.',
+    'comes': 'The bus comes at eight.',
+    'coming': 'The train is coming now.',
+    'become': 'I want to become a teacher.',
+    'becomes': 'She becomes happy when she sings.',
+    'becoming': 'The sky is becoming dark.',
+    'their': 'Their house is big.',
+    'no': 'No, thank you.',
+    'so': 'I am so excited!',
+    'also': 'I also like pizza.',
+    'how': 'How are you today?',
+    'now': 'We can play now.',
+    'where': 'Where is my book?',
+    'here': 'Come here, please.',
+    'there': 'The park is over there.',
+    'any': 'Do you have any questions?',
+    'anywhere': 'We can go anywhere you want.',
+    'anyone': 'Anyone can join the game.',
+    'anything': 'You can ask me anything.',
+    'many': 'There are many flowers.',
+    'front': 'The car is in front of the house.',
+    'very': 'This cake is very good.',
+    'every': 'Every day is special.',
+    'everywhere': 'We looked everywhere for the toy.',
+    'everyone': 'Everyone is welcome here.',
+    'everything': 'Everything will be okay.',
+    'could': 'Could you help me, please?',
+    'would': 'Would you like some juice?',
+    'should': 'You should eat your vegetables.',
+    'when': 'When is your birthday?',
+    'which': 'Which book do you want?',
+    'been': 'I have been waiting for you.',
+    'said': 'She said hello to me.',
+    'each': 'Each child gets a toy.',
+    'asked': 'He asked for help.',
+    'why': 'Why did you do that?',
+    'by': 'The book is by the window.',
+    'my': 'My name is Alex.',
+    'try': 'Try your best!',
+    'put': 'Put the book on the table.',
+    'putting': 'She is putting on her shoes.',
+    'only': 'Only one cookie left.',
+    'work': 'I work at school.',
+    'word': 'This is a new word.',
+    'world': 'The world is beautiful.'
+}
+
+
+def word_story_clips():
+    """(text, output_path) pairs for every word story"""
+    return [(story, f"audio/sentences/{word}-story.mp3") for word, story in WORD_STORIES.items()]
+
+
 class WordStoriesAudioGenerator:
     def __init__(self, api_key=None):
         self.api_key = api_key or os.getenv('ELEVENLABS_API_KEY')
+        # HTTP status of the latest request per output path (None after a network error)
+        self.statuses = {}
         self.base_url = "https://api.elevenlabs.io/v1"
-        self.voice_id = "EXAVITQu4vr4xnSDxMaL"  # Sarah voice (clear woman's voice)
-        self.model_id = "eleven_monolingual_v1"  # High quality model
-        
-        # Audio settings optimized for children's learning - slower and clearer
-        self.voice_settings = {
-            "stability": 0.75,     # More consistent pronunciation
-            "similarity_boost": 0.9,  # Maximum clarity for children
-            "style": 0.0,         # Neutral style
-            "use_speaker_boost": True
-        }
+        self.voice_id = VOICE_ID
+        self.model_id = MODEL_ID
+        self.voice_settings = dict(VOICE_SETTINGS)
         
         if not self.api_key:
             print("❌ Error: ElevenLabs API key not found!")
@@ -31,6 +99,9 @@ class WordStoriesAudioGenerator:
 
     def generate_audio(self, text, output_path):
         """Generate high-quality audio using ElevenLabs API"""
+        # Imported here so that loading the content catalog stays cheap
+        import requests
+
         try:
             url = f"{self.base_url}/text-to-speech/{self.voice_id}"
             
@@ -47,6 +118,7 @@ class WordStoriesAudioGenerator:
             }
             
             response = requests.post(url, json=data, headers=headers)
+            self.statuses[output_path] = response.status_code
             
             if response.status_code == 200:
                 with open(output_path, 'wb') as f:
@@ -59,67 +131,13 @@ class WordStoriesAudioGenerator:
                 return False
                 
         except Exception as e:
+            self.statuses[output_path] = None
             print(f"❌ Error generating {output_path}: {e}")
             return False
 
     def generate_word_stories_audio(self):
         """Generate audio files for all word stories"""
-        word_stories = {
-            'her': 'Her name is Sarah.',
-            'who': 'Who is at the door?',
-            'some': 'I have some cookies.',
-            'out': 'Let\'s go out to play.',
-            'about': 'Tell me about your day.',
-            'too': 'I want to go too!',
-            'two': 'I have two cats.',
-            'were': 'We were happy yesterday.',
-            'what': 'What is your favorite color?',
-            'come': 'Come here, please.',
-            'comes': 'The bus comes at eight.',
-            'coming': 'The train is coming now.',
-            'become': 'I want to become a teacher.',
-            'becomes': 'She becomes happy when she sings.',
-            'becoming': 'The sky is becoming dark.',
-            'their': 'Their house is big.',
-            'no': 'No, thank you.',
-            'so': 'I am so excited!',
-            'also': 'I also like pizza.',
-            'how': 'How are you today?',
-            'now': 'We can play now.',
-            'where': 'Where is my book?',
-            'here': 'Come here, please.',
-            'there': 'The park is over there.',
-            'any': 'Do you have any questions?',
-            'anywhere': 'We can go anywhere you want.',
-            'anyone': 'Anyone can join the game.',
-            'anything': 'You can ask me anything.',
-            'many': 'There are many flowers.',
-            'front': 'The car is in front of the house.',
-            'very': 'This cake is very good.',
-            'every': 'Every day is special.',
-            'everywhere': 'We looked everywhere for the toy.',
-            'everyone': 'Everyone is welcome here.',
-            'everything': 'Everything will be okay.',
-            'could': 'Could you help me, please?',
-            'would': 'Would you like some juice?',
-            'should': 'You should eat your vegetables.',
-            'when': 'When is your birthday?',
-            'which': 'Which book do you want?',
-            'been': 'I have been waiting for you.',
-            'said': 'She said hello to me.',
-            'each': 'Each child gets a toy.',
-            'asked': 'He asked for help.',
-            'why': 'Why did you do that?',
-            'by': 'The book is by the window.',
-            'my': 'My name is Alex.',
-            'try': 'Try your best!',
-            'put': 'Put the book on the table.',
-            'putting': 'She is putting on her shoes.',
-            'only': 'Only one cookie left.',
-            'work': 'I work at school.',
-            'word': 'This is a new word.',
-            'world': 'The world is beautiful.'
-        }
+        word_stories = word_story_clips()
         
         print("🎵 Generating word stories audio files...")
         success_count = 0
@@ -128,8 +146,8 @@ class WordStoriesAudioGenerator:
         sentences_dir = Path("audio/sentences")
         sentences_dir.mkdir(parents=True, exist_ok=True)
         
-        for word, story in word_stories.items():
-            output_path = sentences_dir / f"{word}-story.mp3"
+        for story, output_path in word_stories:
+            output_path = Path(output_path)
             if not output_path.exists():
                 if self.generate_audio(story, output_path):
                     success_count += 1
@@ -12,6 +12,10 @@ class ProgressTracker {
             'only', 'work', 'word', 'world'
         ];
         this.progress = this.loadProgress();
+        this.syncKey = 'sight-words-sync';
+        this.syncState = this.loadSyncState();
+        // Keep answers from a game left mid-session in the next sync
+        window.addEventListener('pagehide', () => this.saveSyncState());
         this.sessionStats = {
             startTime: null,
             endTime: null,
@@ -37,8 +41,8 @@ class ProgressTracker {
             const stored = localStorage.getItem(this.storageKey);
             if (stored) {
                 const parsed = JSON.parse(stored);
-                // Ensure all words are tracked
-                const progress = {};
+                // Keep progress for words in other levels, and ensure all current words are tracked
+                const progress = { ...parsed };
                 this.wordBank.forEach(word => {
                     progress[word] = parsed[word] || {
                         attempts: 0,
@@ -66,6 +70,21 @@ class ProgressTracker {
         return progress;
     }
 
+    // Switch the active word bank (e.g. when a level's content pack loads)
+    setWordBank(words) {
+        this.wordBank = [...words];
+        this.wordBank.forEach(word => {
+            if (!this.progress[word]) {
+                this.progress[word] = {
+                    attempts: 0,
+                    correct: 0,
+                    lastAttempted: null,
+                    accuracy: 0
+                };
+            }
+        });
+    }
+
     saveProgress() {
         try {
             localStorage.setItem(this.storageKey, JSON.stringify(this.progress));
@@ -74,6 +93,169 @@ class ProgressTracker {
         }
     }
 
+    // Written at the end of a session and around each sync, not on every answer;
+    // per-answer deltas wait in memory in the meantime
+    saveSyncState() {
+        try {
+            localStorage.setItem(this.syncKey, JSON.stringify(this.syncState));
+        } catch (error) {
+            console.error('Error saving sync state:', error);
+        }
+    }
+
+    // Sync state: server, learner, this device's batch counter, the deltas not yet
+    // sealed into a batch, and sealed batches the server hasn't acknowledged
+    loadSyncState() {
+        const state = {
+            url: null,
+            learner: null,
+            device: `device-${Math.random().toString(36).slice(2, 10)}`,
+            seq: 0,
+            pending: { words: {}, sessions: [] },
+            outbox: [],
+            // Learners whose totals this device has uploaded (and so already includes)
+            seeded: []
+        };
+        try {
+            const stored = JSON.parse(localStorage.getItem(this.syncKey) || '{}');
+            if (!stored.seeded && stored.learner) {
+                // Configured before seeded was tracked, so its totals were uploaded already
+                stored.seeded = [stored.learner];
+            }
+            return { ...state, ...stored };
+        } catch (error) {
+            console.error('Error loading sync state:', error);
+            return state;
+        }
+    }
+
+    // Point this device at a sync server (progress_sync.py); pass no url to stop syncing
+    configureSync(url, learner) {
+        url = url ? url.replace(/\/$/, '') : null;
+        learner = learner || null;
+        const state = this.syncState;
+        if (url === state.url && learner === state.learner) {
+            return;
+        }
+
+        // Queued batches belong to the previous server or learner, and their deltas
+        // are already part of the local totals that the baseline below uploads
+        state.url = url;
+        state.learner = learner;
+        state.pending = { words: {}, sessions: [] };
+        state.outbox = [];
+        if (url) {
+            // Once this device has synced a learner its totals include every other
+            // device's, so adding them again would double them; replace them instead.
+            // Keyed by learner alone, since the same server may be reached by a new host
+            const seeded = learner !== null && state.seeded.includes(learner);
+            this.queueBaseline(seeded);
+            if (learner !== null && !seeded) {
+                state.seeded.push(learner);
+            }
+        }
+        this.saveSyncState();
+    }
+
+    // Seal every local total into one batch. A reset batch replaces the learner's
+    // totals on the server (after an import or reset); otherwise they are added
+    queueBaseline(reset) {
+        const state = this.syncState;
+        const words = {};
+        Object.entries(this.progress).forEach(([word, stats]) => {
+            if (stats.attempts > 0) {
+                words[word] = [stats.attempts, stats.correct, stats.lastAttempted || null];
+            }
+        });
+        if (reset) {
+            // Nothing queued earlier matters once the server's totals are replaced
+            state.outbox = [];
+            state.pending.words = {};
+        } else if (Object.keys(words).length === 0) {
+            return;
+        }
+        state.seq++;
+        state.outbox.push({ seq: state.seq, reset, words, sessions: [] });
+    }
+
+    queueSyncDelta(word, isCorrect) {
+        if (!this.syncState.url) {
+            return;
+        }
+        const delta = this.syncState.pending.words[word] || [0, 0, null];
+        delta[0]++;
+        if (isCorrect) {
+            delta[1]++;
+        }
+        delta[2] = this.progress[word].lastAttempted;
+        this.syncState.pending.words[word] = delta;
+    }
+
+    // Attempts and correct answers recorded here that the server hasn't acknowledged yet
+    unsyncedDelta(word) {
+        const batches = [...this.syncState.outbox, this.syncState.pending];
+        return batches.reduce(([attempts, correct], batch) => {
+            const delta = batch.words[word];
+            return delta ? [attempts + delta[0], correct + delta[1]] : [attempts, correct];
+        }, [0, 0]);
+    }
+
+    // Upload unsynced deltas and adopt the server's totals across all devices
+    async syncProgress() {
+        const state = this.syncState;
+        if (!state.url || !state.learner) {
+            return false;
+        }
+
+        if (Object.keys(state.pending.words).length > 0 || state.pending.sessions.length > 0) {
+            state.seq++;
+            state.outbox.push({ seq: state.seq, ...state.pending });
+            state.pending = { words: {}, sessions: [] };
+            this.saveSyncState();
+        }
+
+        try {
+            const response = await fetch(`${state.url}/learners/${encodeURIComponent(state.learner)}/progress`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ device: state.device, batches: state.outbox })
+            });
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            const { ack, snapshot } = await response.json();
+            state.outbox = state.outbox.filter(batch => batch.seq > ack);
+            this.saveSyncState();
+            if (state.outbox.some(batch => batch.reset)) {
+                // The server's totals are about to be replaced by a reset queued meanwhile
+                return true;
+            }
+
+            Object.entries(snapshot.words).forEach(([word, [attempts, correct, lastAttempted]]) => {
+                const [unsyncedAttempts, unsyncedCorrect] = this.unsyncedDelta(word);
+                const local = this.progress[word] || { attempts: 0, correct: 0 };
+                // Adopt other devices' attempts, but never lower a local count (e.g. after
+                // another device reset the learner on the server)
+                const remote = attempts + unsyncedAttempts >= local.attempts;
+                const totalAttempts = remote ? attempts + unsyncedAttempts : local.attempts;
+                const totalCorrect = remote ? correct + unsyncedCorrect : local.correct;
+                this.progress[word] = {
+                    ...local,
+                    attempts: totalAttempts,
+                    correct: totalCorrect,
+                    lastAttempted: [local.lastAttempted, lastAttempted].filter(Boolean).sort().pop() || null,
+                    accuracy: totalAttempts > 0 ? totalCorrect / totalAttempts : 0
+                };
+            });
+            this.saveProgress();
+            return true;
+        } catch (error) {
+            // Batches stay in the outbox and are resent on the next sync
+            console.warn('Progress sync failed:', error);
+            return false;
+        }
+    }
+
     startSession(gameType) {
         this.sessionStats = {
             startTime: new Date(),
@@ -87,8 +269,29 @@ class ProgressTracker {
 
     endSession() {
         this.sessionStats.endTime = new Date();
+        const summary = this.getSessionSummary();
+
+        // The sync server keeps the full history; locally only what getSessionHistory reads
+        try {
+            const sessions = JSON.parse(localStorage.getItem('sight-words-sessions') || '[]');
+            sessions.push(summary);
+            localStorage.setItem('sight-words-sessions', JSON.stringify(sessions.slice(-10)));
+        } catch (error) {
+            console.error('Error saving session history:', error);
+        }
+        if (this.syncState.url) {
+            this.syncState.pending.sessions.push([
+                summary.startTime && summary.startTime.toISOString(),
+                summary.endTime.toISOString(),
+                summary.gameType,
+                summary.totalAttempts,
+                summary.correctAttempts
+            ]);
+            this.saveSyncState();
+        }
+
         this.saveProgress();
-        return this.getSessionSummary();
+        return summary;
     }
 
     recordAttempt(word, isCorrect) {
@@ -110,6 +313,7 @@ class ProgressTracker {
         }
         this.progress[word].lastAttempted = new Date().toISOString();
         this.progress[word].accuracy = this.progress[word].correct / this.progress[word].attempts;
+        this.queueSyncDelta(word, isCorrect);
 
         // Update session stats
         this.sessionStats.totalAttempts++;
@@ -352,6 +556,10 @@ class ProgressTracker {
             };
         });
         this.saveProgress();
+        if (this.syncState.url) {
+            this.queueBaseline(true);
+            this.saveSyncState();
+        }
     }
 
     exportProgress() {
@@ -381,6 +589,10 @@ class ProgressTracker {
             if (data.progress && data.version) {
                 this.progress = data.progress;
                 this.saveProgress();
+                if (this.syncState.url) {
+                    this.queueBaseline(true);
+                    this.saveSyncState();
+                }
                 return true;
             }
         } catch (error) {
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Progress sync server for classroom devices
+
+Devices upload what changed since their last sync (per-word attempt/correct
+deltas and finished sessions) in numbered batches, and get back a compact
+snapshot of the learner's totals across every device. Everything lives in one
+SQLite database in WAL mode, so teacher queries read running totals while
+uploads are being written instead of rescanning raw histories.
+
+Upload (POST /learners/<learner>/progress):
+    {"device": "tablet-3",
+     "batches": [{"seq": 4,
+                  "words": {"her": [2, 1, "2024-05-01T09:30:00Z"]},
+                  "sessions": [["<start>", "<end>", "flash-card", 12, 9]]}]}
+
+Word deltas are [attempts, correct, last attempted]; sessions are [start, end,
+game type, attempts, correct]. Batches at or below the device's acknowledged
+seq are skipped, so a device can resend its outbox after a dropped connection.
+A batch with "reset": true replaces the learner's word totals with its words
+instead of adding to them; devices send one after importing or resetting
+progress.
+"""
+
+import gzip
+import json
+import re
+import sqlite3
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+DATABASE_PATH = Path("progress-sync.db")
+# Sessions returned with a snapshot; progress.js only looks at the last 10
+RECENT_SESSIONS = 10
+# Responses smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 1024
+MAX_UPLOAD_BYTES = 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS learners (
+    learner_id TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    updated TEXT
+);
+CREATE TABLE IF NOT EXISTS devices (
+    learner_id TEXT NOT NULL,
+    device_id TEXT NOT NULL,
+    last_seq INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (learner_id, device_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS word_progress (
+    learner_id TEXT NOT NULL,
+    word TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    last_attempted TEXT,
+    PRIMARY KEY (learner_id, word)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS word_progress_by_word ON word_progress (word, learner_id);
+CREATE TABLE IF NOT EXISTS sessions (
+    learner_id TEXT NOT NULL,
+    started TEXT,
+    ended TEXT,
+    game_type TEXT,
+    attempts INTEGER NOT NULL,
+    correct INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_learner ON sessions (learner_id, ended);
+CREATE TABLE IF NOT EXISTS word_totals (
+    word TEXT PRIMARY KEY,
+    learners INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+"""
+
+
+def _count(value, name):
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"{name} must be a non-negative integer")
+    return value
+
+
+def _text(value, name, optional=True):
+    if value is None and optional:
+        return None
+    if not isinstance(value, str) or not value or len(value) > 100:
+        raise ValueError(f"{name} must be a short string")
+    return value
+
+
+def parse_batch(batch):
+    """Validate one uploaded batch; returns (seq, reset, [(word, attempts, correct, last)], [session])"""
+    if not isinstance(batch, dict):
+        raise ValueError("batch must be an object")
+    seq = _count(batch.get('seq'), "seq")
+    reset = batch.get('reset', False)
+    if not isinstance(reset, bool):
+        raise ValueError("reset must be true or false")
+
+    words = []
+    for word, delta in (batch.get('words') or {}).items():
+        if not isinstance(delta, list) or len(delta) not in (2, 3):
+            raise ValueError(f"delta for {word!r} must be [attempts, correct, last attempted]")
+        attempts = _count(delta[0], "attempts")
+        correct = _count(delta[1], "correct")
+        if correct > attempts:
+            raise ValueError(f"delta for {word!r} has more correct answers than attempts")
+        words.append((_text(word, "word", optional=False), attempts, correct,
+                      _text(delta[2] if len(delta) == 3 else None, "last attempted")))
+
+    sessions = []
+    for session in batch.get('sessions') or []:
+        if not isinstance(session, list) or len(session) != 5:
+            raise ValueError("session must be [start, end, game type, attempts, correct]")
+        started, ended, game_type, attempts, correct = session
+        sessions.append((_text(started, "start"), _text(ended, "end"), _text(game_type, "game type"),
+                         _count(attempts, "attempts"), _count(correct, "correct")))
+    return seq, reset, words, sessions
+
+
+class ProgressStore:
+    """SQLite-backed progress store; safe to share between server threads"""
+
+    def __init__(self, path=DATABASE_PATH):
+        self.path = str(path)
+        self.local = threading.local()
+        self.connection().executescript(SCHEMA)
+
+    def connection(self):
+        """This thread's connection (sqlite3 connections can't be shared across threads)"""
+        db = getattr(self.local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            # WAL lets snapshot and classroom reads run while an upload is being written
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self.local.db = db
+        return db
+
+    def upload(self, learner_id, device_id, batches):
+        """Apply a device's batches in one transaction; returns the acknowledged seq"""
+        parsed = sorted((parse_batch(batch) for batch in batches), key=lambda batch: batch[0])
+        db = self.connection()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute("INSERT OR IGNORE INTO learners (learner_id) VALUES (?)", (learner_id,))
+            db.execute("INSERT OR IGNORE INTO devices (learner_id, device_id) VALUES (?, ?)",
+                       (learner_id, device_id))
+            last_seq = db.execute("SELECT last_seq FROM devices WHERE learner_id = ? AND device_id = ?",
+                                  (learner_id, device_id)).fetchone()[0]
+
+            for seq, reset, words, sessions in parsed:
+                if seq <= last_seq:
+                    continue  # Already applied; the device is resending its outbox
+                if reset:
+                    self._reset(db, learner_id)
+                self._apply(db, learner_id, words, sessions)
+                last_seq = seq
+
+            db.execute("UPDATE devices SET last_seq = ? WHERE learner_id = ? AND device_id = ?",
+                       (last_seq, learner_id, device_id))
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return last_seq
+
+    def _reset(self, db, learner_id):
+        """Drop a learner's word progress, taking it back out of the running totals"""
+        rows = db.execute("SELECT word, attempts, correct FROM word_progress WHERE learner_id = ?",
+                          (learner_id,)).fetchall()
+        db.executemany("""UPDATE word_totals
+                          SET learners = learners - 1, attempts = attempts - ?, correct = correct - ?
+                          WHERE word = ?""",
+                       [(attempts, correct, word) for word, attempts, correct in rows])
+        db.execute("DELETE FROM word_progress WHERE learner_id = ?", (learner_id,))
+        db.execute("UPDATE learners SET attempts = 0, correct = 0 WHERE learner_id = ?", (learner_id,))
+
+    def _apply(self, db, learner_id, words, sessions):
+        attempts_total = correct_total = 0
+        for word, attempts, correct, last_attempted in words:
+            new_word = db.execute("INSERT OR IGNORE INTO word_progress (learner_id, word) VALUES (?, ?)",
+                                  (learner_id, word)).rowcount
+            db.execute("""UPDATE word_progress
+                          SET attempts = attempts + ?, correct = correct + ?,
+                              last_attempted = max(coalesce(last_attempted, ''), coalesce(?, ''))
+                          WHERE learner_id = ? AND word = ?""",
+                       (attempts, correct, last_attempted, learner_id, word))
+            db.execute("INSERT OR IGNORE INTO word_totals (word) VALUES (?)", (word,))
+            db.execute("""UPDATE word_totals
+                          SET learners = learners + ?, attempts = attempts + ?, correct = correct + ?
+                          WHERE word = ?""",
+                       (new_word, attempts, correct, word))
+            attempts_total += attempts
+            correct_total += correct
+
+        db.executemany("""INSERT INTO sessions (learner_id, started, ended, game_type, attempts, correct)
+                          VALUES (?, ?, ?, ?, ?, ?)""",
+                       [(learner_id,) + session for session in sessions])
+        db.execute("""UPDATE learners
+                      SET attempts = attempts + ?, correct = correct + ?, sessions = sessions + ?,
+                          updated = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+                      WHERE learner_id = ?""",
+                   (attempts_total, correct_total, len(sessions), learner_id))
+
+    def snapshot(self, learner_id, recent=RECENT_SESSIONS):
+        """A learner's totals across devices, or None for an unknown learner"""
+        db = self.connection()
+        learner = db.execute("SELECT attempts, correct, sessions, updated FROM learners WHERE learner_id = ?",
+                             (learner_id,)).fetchone()
+        if learner is None:
+            return None
+        words = db.execute("""SELECT word, attempts, correct, last_attempted FROM word_progress
+                              WHERE learner_id = ?""", (learner_id,))
+        sessions = db.execute("""SELECT started, ended, game_type, attempts, correct FROM sessions
+                                 WHERE learner_id = ? ORDER BY ended DESC LIMIT ?""",
+                              (learner_id, recent)).fetchall()
+        return {
+            "learner": learner_id,
+            "totals": list(learner),
+            "words": {word: [attempts, correct, last or None] for word, attempts, correct, last in words},
+            "sessions": [list(session) for session in reversed(sessions)]
+        }
+
+    def classroom(self):
+        """Per-word and per-learner totals, read from the running aggregates"""
+        db = self.connection()
+        return {
+            "words": {word: [learners, attempts, correct] for word, learners, attempts, correct
+                      in db.execute("SELECT word, learners, attempts, correct FROM word_totals")},
+            "learners": {learner_id: [attempts, correct, sessions, updated]
+                         for learner_id, attempts, correct, sessions, updated
+                         in db.execute("SELECT learner_id, attempts, correct, sessions, updated FROM learners")}
+        }
+
+    def word(self, word):
+        """Every learner's progress on one word"""
+        rows = self.connection().execute("""SELECT learner_id, attempts, correct, last_attempted
+                                            FROM word_progress WHERE word = ?""", (word,))
+        return {"word": word,
+                "learners": {learner_id: [attempts, correct, last or None]
+                             for learner_id, attempts, correct, last in rows}}
+
+
+class SyncRequestHandler(BaseHTTPRequestHandler):
+    store = None
+
+    def send_json(self, status, data):
+        body = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        gzipped = len(body) >= GZIP_MIN_BYTES and 'gzip' in self.headers.get('Accept-Encoding', '')
+        if gzipped:
+            body = gzip.compress(body)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_cors_headers()
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_cors_headers(self):
+        # The game is served from a different port (sight_words.py serve)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Content-Encoding')
+
+    def read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_UPLOAD_BYTES:
+            raise ValueError("upload too large")
+        body = self.rfile.read(length)
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return json.loads(body or b'{}')
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_cors_headers()
+        self.end_headers()
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        if path == '/classroom':
+            return self.send_json(200, self.store.classroom())
+        match = re.fullmatch(r'/learners/([^/]+)', path)
+        if match:
+            snapshot = self.store.snapshot(unquote(match.group(1)))
+            if snapshot is None:
+                return self.send_json(404, {"error": "unknown learner"})
+            return self.send_json(200, snapshot)
+        match = re.fullmatch(r'/words/([^/]+)', path)
+        if match:
+            return self.send_json(200, self.store.word(unquote(match.group(1))))
+        self.send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        match = re.fullmatch(r'/learners/([^/]+)/progress', self.path.split('?')[0])
+        if not match:
+            return self.send_json(404, {"error": "not found"})
+        learner_id = unquote(match.group(1))
+        try:
+            upload = self.read_json()
+            device_id = _text(upload.get('device'), "device", optional=False)
+            batches = upload.get('batches') or []
+            if not isinstance(batches, list):
+                raise ValueError("batches must be a list")
+            ack = self.store.upload(_text(learner_id, "learner", optional=False), device_id, batches)
+        except (ValueError, AttributeError, OSError) as error:
+            return self.send_json(400, {"error": str(error)})
+        self.send_json(200, {"ack": ack, "snapshot": self.store.snapshot(learner_id)})
+
+
+def serve(port=8001, bind="127.0.0.1", database=DATABASE_PATH):
+    """Run the sync server until interrupted"""
+    handler = type('Handler', (SyncRequestHandler,), {'store': ProgressStore(database)})
+    with ThreadingHTTPServer((bind, port), handler) as httpd:
+        print(f"🔄 Progress sync at http://{bind}:{port}/ using {database} (Ctrl+C to stop)")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Stopped progress sync")
+
+
+def main():
+    from sight_words import main as cli_main
+
+    sys.exit(cli_main(["sync"] + sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
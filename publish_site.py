@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Delta publish - copy only the static site files that changed since the last deploy
+
+The target keeps an inventory (path -> sha256 and size) of what was last
+deployed to it. Each publish hashes the local site, diffs it against that
+inventory and copies only added and changed files, in parallel, in tiers:
+audio bundles and clips first, then each level's content.json (which names
+its bundle), then the entry points that reference the levels. A visitor never
+loads a file that points at one still in flight. Then the new inventory is
+written atomically, and removed files are deleted only after that.
+
+The target is a plain directory, which also serves as a local stand-in for an
+object store: keys are the site-relative paths.
+"""
+
+import fnmatch
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from audio_manifest import MANIFEST_PATH, file_digest, load_manifest
+from audio_renditions import current_renditions, is_rendition_path
+
+# Everything the game loads; generator scripts, docs and the build manifest stay behind
+SITE_PATTERNS = ("index.html", "*.js", "*.css", "audio/**/*.mp3", "packs/**/*.json", "packs/**/*.bin")
+# Upload order: everything else, then the level packs that reference their audio
+# bundles, then the entry points that reference the levels
+LEVEL_PACKS = "packs/level-*/content.json"
+ENTRY_POINTS = ("packs/index.json", "index.html")
+INVENTORY_NAME = ".publish-inventory.json"
+INVENTORY_VERSION = 1
+DEFAULT_WORKERS = 8
+
+
+def site_files(root="."):
+    """Site-relative paths of every file that gets deployed"""
+    root = Path(root)
+    paths = set()
+    for pattern in SITE_PATTERNS:
+        paths.update(path.relative_to(root).as_posix() for path in root.glob(pattern) if path.is_file())
+    # Slow renditions ship only while they match their clip's current recording
+    current = current_renditions(load_manifest(root / MANIFEST_PATH))
+    return sorted(path for path in paths if not is_rendition_path(path) or path in current)
+
+
+def upload_tier(path):
+    """0 for files nothing else waits on, 1 for level packs, 2 for entry points"""
+    if path in ENTRY_POINTS:
+        return 2
+    if fnmatch.fnmatch(path, LEVEL_PACKS):
+        return 1
+    return 0
+
+
+def build_inventory(root=".", workers=DEFAULT_WORKERS):
+    """{path: {"sha256", "bytes"}} for the local site, hashed in parallel"""
+    root = Path(root)
+    paths = site_files(root)
+
+    def describe(path):
+        return path, {"sha256": file_digest(root / path), "bytes": (root / path).stat().st_size}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(describe, paths))
+
+
+def diff_inventories(previous, current):
+    """Split paths into added, changed, removed and unchanged, with the bytes to upload"""
+    delta = {"added": [], "changed": [], "removed": [], "unchanged": []}
+    for path, entry in current.items():
+        if path not in previous:
+            delta["added"].append(path)
+        elif previous[path]["sha256"] != entry["sha256"]:
+            delta["changed"].append(path)
+        else:
+            delta["unchanged"].append(path)
+    delta["removed"] = sorted(set(previous) - set(current))
+    delta["upload_bytes"] = sum(current[path]["bytes"] for path in delta["added"] + delta["changed"])
+    delta["total_bytes"] = sum(entry["bytes"] for entry in current.values())
+    return delta
+
+
+class DirectoryTarget:
+    """Deploy target backed by a local directory"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def load_inventory(self):
+        path = self.root / INVENTORY_NAME
+        if not path.exists():
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('files', {})
+
+    def save_inventory(self, files):
+        """Write the inventory atomically; a failed publish leaves the previous one intact"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / INVENTORY_NAME
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": INVENTORY_VERSION, "files": files}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp_path, path)
+
+    def put(self, source, path):
+        """Copy one file into place atomically"""
+        destination = self.root / path
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = destination.with_name(destination.name + '.tmp')
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, destination)
+
+    def delete(self, path):
+        destination = self.root / path
+        destination.unlink(missing_ok=True)
+        # Drop directories the removal emptied (e.g. a deleted level)
+        parent = destination.parent
+        while parent != self.root and parent.exists() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+
+def publish(target, root=".", workers=DEFAULT_WORKERS, dry_run=False):
+    """Bring the target in line with the local site; returns the delta"""
+    root = Path(root)
+    current = build_inventory(root, workers)
+    delta = diff_inventories(target.load_inventory(), current)
+    if dry_run:
+        return delta
+
+    uploads = delta["added"] + delta["changed"]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for tier in range(3):
+            paths = [path for path in uploads if upload_tier(path) == tier]
+            # list() re-raises the first failed copy before anything points at it
+            list(pool.map(lambda path: target.put(root / path, path), paths))
+
+    target.save_inventory(current)
+    for path in delta["removed"]:
+        target.delete(path)
+    return delta
+
+
+def report(delta, elapsed, verbose=False, dry_run=False):
+    verb = "Would upload" if dry_run else "Uploaded"
+    print(f"🚀 {len(delta['added'])} added, {len(delta['changed'])} changed, "
+          f"{len(delta['removed'])} removed, {len(delta['unchanged'])} unchanged")
+    print(f"   {verb} {delta['upload_bytes'] / 1024:.1f} KB of {delta['total_bytes'] / 1024:.1f} KB "
+          f"in {elapsed:.2f}s")
+    if verbose:
+        for action in ("added", "changed", "removed"):
+            for path in delta[action]:
+                print(f"   {action:>8}  {path}")
+
+
+def main():
+    from sight_words import main as cli_main
+
+    sys.exit(cli_main(["publish"] + sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
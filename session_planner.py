@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Adaptive session planner - Python port of SightWordsGame.generateAdaptiveWordList
+in game.js, plus an indexed version that keeps its buckets up to date as
+attempts are recorded instead of re-bucketing the whole word bank every session
+
+Progress uses the same shape as progress.js: {word: {"attempts": n, "correct": n, ...}}.
+"""
+
+import random
+from bisect import bisect_left, insort
+
+SESSION_LENGTH = 12
+# Share of each session drawn from the weak and medium buckets; strong words fill the rest
+WEAK_SHARE = 0.5
+MEDIUM_SHARE = 0.3
+
+
+def accuracy(stats):
+    """Accuracy as the game computes it; untried words count as 0"""
+    attempts = stats.get('attempts', 0) if stats else 0
+    return stats['correct'] / attempts if attempts > 0 else 0
+
+
+def bucket_for(stats):
+    """'weak', 'medium' or 'strong', using the thresholds from game.js"""
+    attempts = stats.get('attempts', 0) if stats else 0
+    word_accuracy = accuracy(stats)
+    if word_accuracy < 0.5 or attempts < 2:
+        return 'weak'
+    if word_accuracy < 0.8 or attempts < 4:
+        return 'medium'
+    return 'strong'
+
+
+def bucket_counts(session_length, weak, medium, strong):
+    """How many words each bucket contributes: 50% weak, 30% medium, 20% strong"""
+    weak_count = min(-(-session_length * WEAK_SHARE // 1), weak)
+    medium_count = min(-(-session_length * MEDIUM_SHARE // 1), medium)
+    strong_count = min(session_length - weak_count - medium_count, strong)
+    return int(weak_count), int(medium_count), int(max(strong_count, 0))
+
+
+def _add_with_variety(pool, count, rng):
+    """Take the first `count` words of a pool, topping up at random if it is too small"""
+    added = list(pool[:count])
+    used = set(added)
+    while len(added) < count and pool:
+        available = [word for word in pool if word not in used]
+        if not available:
+            # Every word is used; allow repetition
+            added.append(pool[rng.randrange(len(pool))])
+        else:
+            word = available[rng.randrange(len(available))]
+            added.append(word)
+            used.add(word)
+    return added
+
+
+def _finish(word_list, word_bank, session_length, rng):
+    """Fill from the rest of the bank if needed, then shuffle (shared by both planners)"""
+    if len(word_list) < session_length:
+        used = set(word_list)
+        available = [word for word in word_bank if word not in used]
+        while len(word_list) < session_length and available:
+            word_list.append(available.pop(rng.randrange(len(available))))
+
+    for i in range(len(word_list) - 1, 0, -1):
+        j = rng.randrange(i + 1)
+        word_list[i], word_list[j] = word_list[j], word_list[i]
+    return word_list[:session_length]
+
+
+def plan_session(word_bank, progress, session_length=SESSION_LENGTH, rng=random):
+    """Reference planner: a direct port of generateAdaptiveWordList.
+
+    Buckets are rebuilt and re-sorted on every call. Two deliberate
+    differences: the game's sort comparators divide by attempts directly, so
+    untried words compare as NaN and their order depends on the browser (here
+    they sort as accuracy 0, like the bucketing code already treats them), and
+    the no-progress shuffle is an unbiased Fisher-Yates rather than a random
+    comparator.
+    """
+    if not progress:
+        shuffled = list(word_bank)
+        rng.shuffle(shuffled)
+        return shuffled[:session_length]
+
+    weak, medium, strong = [], [], []
+    for word in word_bank:
+        bucket = bucket_for(progress.get(word))
+        (weak if bucket == 'weak' else medium if bucket == 'medium' else strong).append(word)
+
+    weak.sort(key=lambda word: accuracy(progress.get(word)))
+    strong.sort(key=lambda word: -accuracy(progress.get(word)))
+
+    weak_count, medium_count, strong_count = bucket_counts(
+        session_length, len(weak), len(medium), len(strong))
+
+    word_list = []
+    word_list += _add_with_variety(weak, weak_count, rng)
+    word_list += _add_with_variety(medium, medium_count, rng)
+    word_list += _add_with_variety(strong, strong_count, rng)
+    return _finish(word_list, word_bank, session_length, rng)
+
+
+class IndexedPlanner:
+    """Planner that keeps each bucket sorted as attempts come in.
+
+    Recording an attempt moves one word between sorted buckets (O(log n)
+    search plus a list shift), and planning reads the head of each bucket, so
+    the cost of a session no longer grows with the word bank. For the same
+    progress and random seed it returns exactly what plan_session returns.
+    """
+
+    def __init__(self, word_bank, progress=None):
+        self.word_bank = list(word_bank)
+        self.position = {word: i for i, word in enumerate(self.word_bank)}
+        self.stats = {}
+        self.keys = {}
+        self.buckets = {'weak': [], 'medium': [], 'strong': []}
+        self.has_progress = bool(progress)
+        for word in self.word_bank:
+            stats = (progress or {}).get(word) or {}
+            self.stats[word] = [stats.get('attempts', 0), stats.get('correct', 0)]
+            self._insert(word)
+
+    def _key(self, word):
+        attempts, correct = self.stats[word]
+        stats = {'attempts': attempts, 'correct': correct}
+        bucket = bucket_for(stats)
+        # Bank position breaks ties, matching the stable sort in plan_session
+        if bucket == 'weak':
+            return bucket, (accuracy(stats), self.position[word], word)
+        if bucket == 'strong':
+            return bucket, (-accuracy(stats), self.position[word], word)
+        return bucket, (self.position[word], word)
+
+    def _insert(self, word):
+        bucket, key = self._key(word)
+        insort(self.buckets[bucket], key)
+        self.keys[word] = (bucket, key)
+
+    def _remove(self, word):
+        bucket, key = self.keys.pop(word)
+        entries = self.buckets[bucket]
+        del entries[bisect_left(entries, key)]
+
+    def record(self, word, correct):
+        """Record one attempt, as ProgressTracker.recordAttempt does"""
+        self.has_progress = True
+        if word not in self.position:
+            # The game never plans words outside its bank either
+            return
+        self._remove(word)
+        self.stats[word][0] += 1
+        self.stats[word][1] += 1 if correct else 0
+        self._insert(word)
+
+    def progress(self):
+        """Progress in the progress.js shape"""
+        return {word: {'attempts': attempts, 'correct': correct}
+                for word, (attempts, correct) in self.stats.items()}
+
+    def plan(self, session_length=SESSION_LENGTH, rng=random):
+        if not self.has_progress:
+            shuffled = list(self.word_bank)
+            rng.shuffle(shuffled)
+            return shuffled[:session_length]
+
+        sizes = {name: len(entries) for name, entries in self.buckets.items()}
+        counts = bucket_counts(session_length, sizes['weak'], sizes['medium'], sizes['strong'])
+
+        word_list = []
+        for name, count in zip(('weak', 'medium', 'strong'), counts):
+            entries = self.buckets[name]
+            if count <= len(entries):
+                word_list += [key[-1] for key in entries[:count]]
+            else:
+                # Only small buckets need the whole pool for random top-ups
+                word_list += _add_with_variety([key[-1] for key in entries], count, rng)
+        return _finish(word_list, self.word_bank, session_length, rng)
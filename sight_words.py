@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Sight Words build tool - one entry point for planning, building, auditing and
+serving the game's audio and static files
+
+Each subcommand imports only what it needs, so a fully cached build never
+loads requests or talks to the network.
+"""
+
+import argparse
+import sys
+import time
+
+
+def cmd_plan(args):
+    """Show which clips a build would synthesize, without doing any work"""
+    from audio_catalog import build_catalog, plan_changes
+    from audio_manifest import load_manifest
+
+    catalog = build_catalog()
+    plan = plan_changes(catalog, load_manifest())
+    characters = sum(len(catalog[path]['text']) for path in plan['synthesize'])
+
+    print(f"📋 {len(catalog)} clips in catalog")
+    print(f"   🎵 {len(plan['synthesize'])} to synthesize ({characters} API characters)")
+    print(f"   📥 {len(plan['adopt'])} to adopt from disk")
+    print(f"   🗑️  {len(plan['removed'])} to remove")
+    if args.verbose:
+        for action in ("synthesize", "adopt", "removed"):
+            for output_path in plan[action]:
+                print(f"   {action:>10}  {output_path}")
+    return 0
+
+
+def cmd_build(args):
+    """Synthesize changed clips and refresh the manifest"""
+    from audio_build import AudioBuilder, report
+
+    started = time.monotonic()
+    summary = AudioBuilder(synth_workers=args.synth_workers, process_workers=args.process_workers,
+                           queue_size=args.queue_size, trim=args.trim).build()
+    report("build", summary, time.monotonic() - started)
+    return 1 if summary['failed'] else 0
+
+
+def cmd_watch(args):
+    """Rebuild changed clips whenever a generator script is saved"""
+    from watch_audio import AudioWatcher
+
+    watcher = AudioWatcher(interval=args.interval, synth_workers=args.synth_workers,
+                           process_workers=args.process_workers, queue_size=args.queue_size,
+                           trim=args.trim)
+    if args.once:
+        watcher.run_once()
+    else:
+        watcher.watch()
+    return 0
+
+
+def cmd_packs(args):
+    """Build the per-level content packs the game loads on demand"""
+    from build_content_packs import ContentPackBuilder
+
+    builder = ContentPackBuilder.from_sources()
+    unknown = sorted(set(args.level or []) - set(builder.levels))
+    if unknown:
+        args.parser.error(f"unknown level {', '.join(map(str, unknown))} "
+                          f"(levels: {', '.join(map(str, sorted(builder.levels)))})")
+    levels = builder.build(args.level or None)
+    print(f"✅ Built {len(levels)} content packs in {builder.output_dir}/")
+    return 0
+
+
+def cmd_renditions(args):
+    """Derive missing or outdated slow renditions of word and letter clips"""
+    from audio_manifest import load_manifest, save_manifest
+    from audio_renditions import SLOW_SPEEDS, derive_renditions
+    from build_content_packs import ContentPackBuilder
+
+    manifest = load_manifest()
+    derived = derive_renditions(manifest, speeds=args.speed or SLOW_SPEEDS, workers=args.process_workers)
+    if derived:
+        save_manifest(manifest)
+        ContentPackBuilder.from_sources().rebuild_affected(manifest, None, derived, [])
+    return 0
+
+
+def cmd_distractors(args):
+    """Show the generated Multiple Choice distractors for some or all words"""
+    from build_distractors import build_distractor_table
+    from generate_high_quality_audio import WORDS
+
+    words = args.words or WORDS
+    table = build_distractor_table(WORDS + [word for word in words if word not in WORDS])
+    for word in words:
+        print(f"{word:>12}: {', '.join(table[word])}")
+    return 0
+
+
+def cmd_simulate(args):
+    """Replay adaptive sessions for many learners and benchmark the session planners"""
+    from simulate_sessions import report, run_simulation
+
+    summary = run_simulation(learners=args.learners, sessions=args.sessions,
+                             bank_size=args.bank_size, history_paths=args.histories,
+                             session_length=args.session_length, workers=args.workers,
+                             seed=args.seed)
+    return 0 if report(summary) else 1
+
+
+def cmd_audit(args):
+    """Check every manifest entry against the file on disk"""
+    from pathlib import Path
+
+    from audio_manifest import clip_files, file_digest, load_manifest
+
+    manifest = load_manifest()
+    recorded = clip_files(manifest)
+    missing, modified = [], []
+    for output_path, sha256 in sorted(recorded.items()):
+        if not Path(output_path).exists():
+            missing.append(output_path)
+        elif file_digest(output_path) != sha256:
+            modified.append(output_path)
+
+    untracked = sorted(str(path) for path in Path("audio").rglob("*.mp3")
+                       if str(path) not in recorded)
+
+    print(f"🔍 Audited {len(manifest['clips'])} clips and "
+          f"{len(recorded) - len(manifest['clips'])} renditions")
+    for label, paths in (("❌ missing", missing), ("✏️  modified", modified),
+                         ("❔ untracked", untracked)):
+        print(f"   {label}: {len(paths)}")
+        if args.verbose:
+            for output_path in paths:
+                print(f"      {output_path}")
+    return 1 if missing or modified else 0
+
+
+def cmd_sweep(args):
+    """Remove generated clips whose content is gone, leftover temp files and expired cache"""
+    from pathlib import Path
+
+    from audio_catalog import build_catalog, plan_changes
+    from audio_manifest import load_manifest, remove_clip, save_manifest
+    from audio_renditions import remove_renditions
+    from voice_cache import sweep_cache
+
+    manifest = load_manifest()
+    plan = plan_changes(build_catalog(), manifest)
+    leftovers = [str(path) for path in Path("audio").rglob("*.tmp")]
+
+    for output_path in plan['removed'] + leftovers:
+        print(f"🗑️  {'Would remove' if args.dry_run else 'Removed'}: {output_path}")
+        if not args.dry_run:
+            Path(output_path).unlink(missing_ok=True)
+
+    if not args.dry_run:
+        for output_path in plan['removed']:
+            remove_clip(manifest, output_path)
+            remove_renditions(output_path)
+        if plan['removed']:
+            save_manifest(manifest)
+        expired = sweep_cache()
+        if expired:
+            print(f"🧹 Dropped {expired} expired voice cache entries")
+    return 0
+
+
+def cmd_serve(args):
+    """Serve the game locally"""
+    import functools
+    import http.server
+
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=args.directory)
+    with http.server.ThreadingHTTPServer((args.bind, args.port), handler) as httpd:
+        print(f"🌐 Serving {args.directory} at http://{args.bind}:{args.port}/ (Ctrl+C to stop)")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Stopped serving")
+    return 0
+
+
+def cmd_publish(args):
+    """Deploy only the site files that changed since the last publish to a target directory"""
+    from publish_site import DirectoryTarget, publish, report
+
+    started = time.monotonic()
+    delta = publish(DirectoryTarget(args.target), workers=args.workers, dry_run=args.dry_run)
+    report(delta, time.monotonic() - started, verbose=args.verbose, dry_run=args.dry_run)
+    return 0
+
+
+def cmd_sync(args):
+    """Run the progress sync server for classroom devices"""
+    from progress_sync import serve
+
+    serve(port=args.port, bind=args.bind, database=args.database)
+    return 0
+
+
+def cmd_report(args):
+    """Summarize the manifest and the cached voice list"""
+    import os
+    from collections import defaultdict
+
+    from audio_manifest import load_manifest
+
+    manifest = load_manifest()
+    totals = defaultdict(lambda: {"clips": 0, "bytes": 0, "characters": 0})
+    for entry in manifest['clips'].values():
+        category = totals[entry['category']]
+        category['clips'] += 1
+        category['bytes'] += entry['bytes']
+        category['characters'] += len(entry['text'])
+
+    print("📊 Audio report")
+    print(f"   {'category':<16}{'clips':>8}{'KB':>10}{'chars':>10}")
+    for name, category in sorted(totals.items()):
+        print(f"   {name:<16}{category['clips']:>8}{category['bytes'] / 1024:>10.1f}"
+              f"{category['characters']:>10}")
+    print(f"   {'total':<16}{sum(c['clips'] for c in totals.values()):>8}"
+          f"{sum(c['bytes'] for c in totals.values()) / 1024:>10.1f}"
+          f"{sum(c['characters'] for c in totals.values()):>10}")
+
+    if args.voices:
+        from voice_cache import cached_voices, get_voices
+
+        api_key = os.getenv('ELEVENLABS_API_KEY')
+        voices = cached_voices(api_key) if not args.refresh else None
+        if voices is None and api_key:
+            voices = get_voices(api_key, refresh=args.refresh)
+        print("\n🔍 Available voices:")
+        for voice in voices or []:
+            print(f"  - {voice['name']} (ID: {voice['voice_id']})")
+    return 0
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def add_pipeline_arguments(parser):
+    parser.add_argument("--synth-workers", type=positive_int, default=2,
+                        help="concurrent API requests (default: 2)")
+    parser.add_argument("--process-workers", type=positive_int, default=None,
+                        help="post-processing processes (default: up to 4)")
+    parser.add_argument("--queue-size", type=positive_int, default=8,
+                        help="clips buffered between stages (default: 8)")
+    parser.add_argument("--trim", action="store_true",
+                        help="trim leading/trailing silence with ffmpeg")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="sight_words.py", description=__doc__.strip().split('\n')[0])
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.required = True
+
+    plan = subparsers.add_parser("plan", help=cmd_plan.__doc__)
+    plan.add_argument("-v", "--verbose", action="store_true", help="list every affected clip")
+    plan.set_defaults(func=cmd_plan)
+
+    build = subparsers.add_parser("build", help=cmd_build.__doc__)
+    add_pipeline_arguments(build)
+    build.set_defaults(func=cmd_build)
+
+    watch = subparsers.add_parser("watch", help=cmd_watch.__doc__)
+    watch.add_argument("--interval", type=float, default=0.5,
+                       help="seconds between checks of the generator scripts (default: 0.5)")
+    watch.add_argument("--once", action="store_true",
+                       help="sync the audio tree once and exit instead of watching")
+    add_pipeline_arguments(watch)
+    watch.set_defaults(func=cmd_watch)
+
+    packs = subparsers.add_parser("packs", help=cmd_packs.__doc__)
+    packs.add_argument("--level", type=int, action="append",
+                       help="only rebuild this level (repeatable)")
+    # The levels come from the generator scripts, so --level is checked once they're loaded
+    packs.set_defaults(func=cmd_packs, parser=packs)
+
+    renditions = subparsers.add_parser("renditions", help=cmd_renditions.__doc__)
+    renditions.add_argument("--speed", type=float, action="append",
+                            help="playback speed to derive (repeatable, default: 0.75 and 0.9)")
+    renditions.add_argument("--process-workers", type=positive_int, default=None,
+                            help="ffmpeg processes (default: up to 4)")
+    renditions.set_defaults(func=cmd_renditions)
+
+    distractors = subparsers.add_parser("distractors", help=cmd_distractors.__doc__)
+    distractors.add_argument("words", nargs="*", help="words to show (default: all)")
+    distractors.set_defaults(func=cmd_distractors)
+
+    simulate = subparsers.add_parser("simulate", help=cmd_simulate.__doc__)
+    simulate.add_argument("histories", nargs="*",
+                          help="exported progress files to start learners from (default: new learners)")
+    simulate.add_argument("--learners", type=positive_int, default=1000)
+    simulate.add_argument("--sessions", type=positive_int, default=20, help="sessions per learner (default: 20)")
+    simulate.add_argument("--session-length", type=positive_int, default=12)
+    simulate.add_argument("--bank-size", type=int, default=None,
+                          help="pad the word bank with made-up words up to this size")
+    simulate.add_argument("--workers", type=positive_int, default=None,
+                          help="simulation processes (default: one per CPU)")
+    simulate.add_argument("--seed", type=int, default=0)
+    simulate.set_defaults(func=cmd_simulate)
+
+    audit = subparsers.add_parser("audit", help=cmd_audit.__doc__)
+    audit.add_argument("-v", "--verbose", action="store_true", help="list every problem file")
+    audit.set_defaults(func=cmd_audit)
+
+    sweep = subparsers.add_parser("sweep", help=cmd_sweep.__doc__)
+    sweep.add_argument("-n", "--dry-run", action="store_true", help="only show what would be removed")
+    sweep.set_defaults(func=cmd_sweep)
+
+    serve = subparsers.add_parser("serve", help=cmd_serve.__doc__)
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument("--bind", default="127.0.0.1")
+    serve.add_argument("--directory", default=".")
+    serve.set_defaults(func=cmd_serve)
+
+    publish = subparsers.add_parser("publish", help=cmd_publish.__doc__)
+    publish.add_argument("target", help="directory to deploy to (or a local object-store stand-in)")
+    publish.add_argument("--workers", type=positive_int, default=8, help="parallel copies (default: 8)")
+    publish.add_argument("-n", "--dry-run", action="store_true", help="only show the delta")
+    publish.add_argument("-v", "--verbose", action="store_true", help="list every added, changed and removed file")
+    publish.set_defaults(func=cmd_publish)
+
+    sync = subparsers.add_parser("sync", help=cmd_sync.__doc__)
+    sync.add_argument("--port", type=int, default=8001)
+    sync.add_argument("--bind", default="127.0.0.1")
+    sync.add_argument("--database", default="progress-sync.db", help="SQLite database file")
+    sync.set_defaults(func=cmd_sync)
+
+    report = subparsers.add_parser("report", help=cmd_report.__doc__)
+    report.add_argument("--voices", action="store_true", help="also list voices (from cache when fresh)")
+    report.add_argument("--refresh", action="store_true", help="revalidate the voice cache now")
+    report.set_defaults(func=cmd_report)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
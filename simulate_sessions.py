@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Replay adaptive sessions for thousands of learners
+
+Each learner plays a run of 12-word sessions planned by session_planner. Both
+the reference port of generateAdaptiveWordList and the indexed planner plan
+every session from the same random seed, so the run reports which words the
+game ends up drilling, what each planner costs per call, and whether the
+indexed planner ever disagrees with the reference.
+
+Learners are synthetic (a hidden per-word skill that grows with practice) or
+start from progress files exported by the game's "Export Progress" button.
+"""
+
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from session_planner import SESSION_LENGTH, IndexedPlanner, bucket_for, plan_session
+
+# How much a learner's hidden skill on a word moves towards 1 after each attempt
+LEARNING_RATE = 0.08
+LEARNERS_PER_TASK = 50
+
+
+def load_history(path):
+    """Progress blob from an exported progress file (or a raw localStorage dump)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('progress', data)
+
+
+def word_bank_for(bank_size=None, histories=()):
+    """The game's words, padded with made-up words up to bank_size, plus any words in histories"""
+    from generate_high_quality_audio import WORDS
+
+    words = list(WORDS)
+    for i in range(len(words), bank_size or 0):
+        words.append(f"word{i:05d}")
+    for progress in histories:
+        words += [word for word in progress if word not in words]
+    return words
+
+
+def initial_progress(word_bank, history=None):
+    """Progress the way ProgressTracker.loadProgress leaves it: every word present"""
+    progress = {word: {'attempts': 0, 'correct': 0} for word in word_bank}
+    for word, stats in (history or {}).items():
+        progress[word] = {'attempts': stats.get('attempts', 0), 'correct': stats.get('correct', 0)}
+    return progress
+
+
+def simulate_learners(task):
+    """Worker: play every session for a chunk of learners and return aggregate counts"""
+    word_bank, histories, first_learner, learners, sessions, session_length, seed = task
+    selections, buckets = Counter(), Counter()
+    reference_times, indexed_times = [], []
+    mismatches = repeats = mastered = 0
+
+    for learner in range(first_learner, first_learner + learners):
+        rng = random.Random(seed * 1000003 + learner)
+        history = histories[learner % len(histories)] if histories else None
+        progress = initial_progress(word_bank, history)
+        planner = IndexedPlanner(word_bank, progress)
+        skill = {word: rng.betavariate(2, 3) for word in word_bank}
+        for word, stats in progress.items():
+            if stats['attempts']:
+                skill[word] = max(skill[word], stats['correct'] / stats['attempts'])
+
+        for _ in range(sessions):
+            session_seed = rng.getrandbits(64)
+
+            started = time.perf_counter()
+            words = plan_session(word_bank, progress, session_length, random.Random(session_seed))
+            reference_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            indexed = planner.plan(session_length, random.Random(session_seed))
+            indexed_times.append(time.perf_counter() - started)
+
+            mismatches += words != indexed
+            repeats += len(words) - len(set(words))
+            for word in words:
+                selections[word] += 1
+                buckets[bucket_for(progress[word])] += 1
+                correct = rng.random() < skill[word]
+                progress[word]['attempts'] += 1
+                progress[word]['correct'] += 1 if correct else 0
+                planner.record(word, correct)
+                skill[word] += (1 - skill[word]) * LEARNING_RATE
+
+        mastered += sum(1 for word in word_bank if bucket_for(progress[word]) == 'strong')
+
+    return {
+        "selections": selections,
+        "buckets": buckets,
+        "reference_times": reference_times,
+        "indexed_times": indexed_times,
+        "mismatches": mismatches,
+        "repeats": repeats,
+        "mastered": mastered,
+    }
+
+
+def run_simulation(learners=1000, sessions=20, bank_size=None, history_paths=(),
+                   session_length=SESSION_LENGTH, workers=None, seed=0):
+    """Simulate learners across a process pool and merge the workers' results"""
+    histories = [load_history(path) for path in history_paths]
+    word_bank = word_bank_for(bank_size, histories)
+    tasks = [(word_bank, histories, first, min(LEARNERS_PER_TASK, learners - first),
+              sessions, session_length, seed)
+             for first in range(0, learners, LEARNERS_PER_TASK)]
+
+    summary = {
+        "learners": learners,
+        "sessions": sessions,
+        "word_bank": word_bank,
+        "selections": Counter(),
+        "buckets": Counter(),
+        "reference_times": [],
+        "indexed_times": [],
+        "mismatches": 0,
+        "repeats": 0,
+        "mastered": 0,
+    }
+    workers = workers or min(len(tasks), os.cpu_count() or 1)
+    started = time.monotonic()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(simulate_learners, tasks):
+            for key, value in result.items():
+                summary[key] += value
+    summary['elapsed'] = time.monotonic() - started
+    return summary
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0
+
+
+def report(summary, top=8):
+    calls = summary['learners'] * summary['sessions']
+    picks = sum(summary['selections'].values())
+    word_bank = summary['word_bank']
+
+    print(f"🎲 {summary['learners']} learners x {summary['sessions']} sessions "
+          f"over {len(word_bank)} words in {summary['elapsed']:.1f}s")
+
+    print("\n📊 Selection by bucket at planning time:")
+    for bucket in ('weak', 'medium', 'strong'):
+        share = summary['buckets'][bucket] / picks if picks else 0
+        print(f"   {bucket:<8}{share:>7.1%}")
+
+    never = [word for word in word_bank if not summary['selections'][word]]
+    per_learner = {word: summary['selections'][word] / summary['learners'] for word in word_bank}
+    ranked = sorted(word_bank, key=lambda word: -per_learner[word])
+    print("\n🔤 Picks per learner (most): "
+          + ", ".join(f"{word} {per_learner[word]:.1f}" for word in ranked[:top]))
+    print("   Picks per learner (least): "
+          + ", ".join(f"{word} {per_learner[word]:.1f}" for word in ranked[-top:]))
+    print(f"   Never picked: {len(never)} words")
+    print(f"   Repeated within a session: {summary['repeats'] / calls:.2f} words per session")
+    print(f"   Strong by the end: {summary['mastered'] / summary['learners']:.1f} words per learner")
+
+    print(f"\n⏱️  Per-call cost over {calls} sessions:")
+    print(f"   {'planner':<12}{'mean µs':>10}{'p50 µs':>10}{'p95 µs':>10}")
+    for label, key in (("reference", 'reference_times'), ("indexed", 'indexed_times')):
+        times = summary[key]
+        print(f"   {label:<12}{sum(times) / len(times) * 1e6:>10.1f}"
+              f"{_percentile(times, 0.5) * 1e6:>10.1f}{_percentile(times, 0.95) * 1e6:>10.1f}")
+
+    if summary['mismatches']:
+        print(f"\n❌ Indexed planner differed from the reference in {summary['mismatches']} sessions")
+    else:
+        print("\n✅ Indexed planner matched the reference in every session")
+    return summary['mismatches'] == 0
+
+
+def main():
+    from sight_words import main as cli_main
+
+    sys.exit(cli_main(["simulate"] + sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
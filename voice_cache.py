@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of ElevenLabs voice metadata with a TTL and conditional
+revalidation, so routine runs never wait on /v1/voices
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(os.getenv('SIGHT_WORDS_CACHE_DIR', Path.home() / '.cache' / 'sight-words'))
+VOICES_CACHE_PATH = CACHE_DIR / 'voices.json'
+DEFAULT_TTL = 24 * 60 * 60  # Voices rarely change; revalidate once a day
+
+
+def _account_key(api_key):
+    """Cache entries are per account without storing the key itself"""
+    return hashlib.sha256((api_key or '').encode('utf-8')).hexdigest()[:16]
+
+
+def load_cache(path=VOICES_CACHE_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_cache(cache, path=VOICES_CACHE_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+
+def cached_voices(api_key, ttl=DEFAULT_TTL, path=VOICES_CACHE_PATH):
+    """Voices from the cache if they are still fresh, otherwise None"""
+    entry = load_cache(path).get(_account_key(api_key))
+    if entry and time.time() - entry['fetched_at'] < ttl:
+        return entry['voices']
+    return None
+
+
+def get_voices(api_key, base_url="https://api.elevenlabs.io/v1", ttl=DEFAULT_TTL,
+               refresh=False, path=VOICES_CACHE_PATH):
+    """Voice list for an account.
+
+    Fresh cache entries are returned without touching the network. Stale ones
+    are revalidated with If-None-Match/If-Modified-Since, so an unchanged list
+    costs a 304 and no body. If the API cannot be reached the stale list is
+    still returned.
+    """
+    cache = load_cache(path)
+    account = _account_key(api_key)
+    entry = cache.get(account)
+
+    if entry and not refresh and time.time() - entry['fetched_at'] < ttl:
+        return entry['voices']
+
+    import requests
+
+    headers = {"xi-api-key": api_key}
+    if entry and entry.get('etag'):
+        headers["If-None-Match"] = entry['etag']
+    if entry and entry.get('last_modified'):
+        headers["If-Modified-Since"] = entry['last_modified']
+
+    try:
+        response = requests.get(f"{base_url}/voices", headers=headers, timeout=10)
+    except Exception as e:
+        print(f"Error getting voices: {e}")
+        return entry['voices'] if entry else []
+
+    if response.status_code == 304 and entry:
+        entry['fetched_at'] = time.time()
+    elif response.status_code == 200:
+        entry = {
+            "voices": [{"name": voice['name'], "voice_id": voice['voice_id']}
+                       for voice in response.json()['voices']],
+            "etag": response.headers.get('ETag'),
+            "last_modified": response.headers.get('Last-Modified'),
+            "fetched_at": time.time()
+        }
+    else:
+        print(f"Failed to get voices: {response.status_code}")
+        return entry['voices'] if entry else []
+
+    cache[account] = entry
+    save_cache(cache, path)
+    return entry['voices']
+
+
+def sweep_cache(ttl=DEFAULT_TTL, path=VOICES_CACHE_PATH):
+    """Drop cache entries that are too old to be worth revalidating; returns how many"""
+    cache = load_cache(path)
+    expired = [account for account, entry in cache.items()
+               if time.time() - entry.get('fetched_at', 0) >= ttl * 7]
+    for account in expired:
+        del cache[account]
+    if expired:
+        save_cache(cache, path)
+    return len(expired)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the audio generators - regenerates only the clips whose content
+changed whenever one of the generator scripts is saved
+"""
+
+import argparse
+import time
+
+from audio_build import AudioBuilder, report
+from audio_catalog import SOURCES, source_path
+
+
+class AudioWatcher(AudioBuilder):
+    def __init__(self, interval=0.5, api_key=None, **pipeline_options):
+        super().__init__(api_key=api_key, **pipeline_options)
+        self.interval = interval
+        self.mtimes = {}
+
+    def snapshot_mtimes(self):
+        """Current modification time of every content source"""
+        mtimes = {}
+        for module_name, _, _ in SOURCES:
+            try:
+                mtimes[module_name] = source_path(module_name).stat().st_mtime_ns
+            except FileNotFoundError:
+                mtimes[module_name] = None
+        return mtimes
+
+    def run_once(self):
+        """Load every source and bring the audio tree up to date"""
+        started = time.monotonic()
+        self.mtimes = self.snapshot_mtimes()
+        summary = self.build()
+        report("initial sync", summary, time.monotonic() - started)
+
+    def watch(self):
+        """Poll the content sources and regenerate on every save"""
+        self.run_once()
+        print(f"👀 Watching {', '.join(f'{name}.py' for name, _, _ in SOURCES)} "
+              "(Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(self.interval)
+                mtimes = self.snapshot_mtimes()
+                changed_sources = [name for name in mtimes if mtimes[name] != self.mtimes.get(name)]
+                if not changed_sources:
+                    continue
+                self.mtimes = mtimes
+
+                started = time.monotonic()
+                loaded = self.load_sources(changed_sources)
+                if not loaded:
+                    continue
+                summary = self.apply(self.catalog())
+                report(", ".join(f"{name}.py" for name in loaded), summary,
+                       time.monotonic() - started)
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate audio clips as their content changes")
+    parser.add_argument("--interval", type=float, default=0.5,
+                        help="seconds between checks of the generator scripts (default: 0.5)")
+    parser.add_argument("--once", action="store_true",
+                        help="sync the audio tree once and exit instead of watching")
+    args = parser.parse_args()
+
+    print("🎵 Sight Words Audio Watcher 🎵")
+    print("=" * 50)
+
+    watcher = AudioWatcher(interval=args.interval)
+    if args.once:
+        watcher.run_once()
+    else:
+        watcher.watch()
+
+
+if __name__ == "__main__":
+    main()